@@ -13,7 +13,8 @@ from src.model_manager import ModelManager# Load environment variables
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+# Timestamps (with milliseconds) come from the formatter, only for records that are emitted
+logging.basicConfig(level=logging.INFO, format="%(asctime)s.%(msecs)03d %(levelname)s:%(name)s:%(message)s", datefmt="%H:%M:%S")
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
@@ -45,25 +46,25 @@ def process_query():
             return jsonify({"error": "Query or text parameter required"}), 400
         
         query = data.get("query") or data.get("text")
-        logger.info(f"🚀 QUERY START: {query[:50]}... at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
+        logger.info(f"🚀 QUERY START: {query[:50]}...")
         
         # Step 1: Get AI response
         grok_start = time.time()
-        logger.info(f"📤 SENT to GROK at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
+        logger.info("📤 SENT to GROK")
         ai_response = grok_client.get_response(query)
         grok_end = time.time()
-        logger.info(f"📥 RECEIVED from GROK at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} ({grok_end - grok_start:.3f}s, {len(ai_response)} chars)")
+        logger.info(f"📥 RECEIVED from GROK ({grok_end - grok_start:.3f}s, {len(ai_response)} chars)")
         
         # Step 2: Generate TTS audio
         polly_start = time.time()
-        logger.info(f"🔊 SENT to POLLY at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
+        logger.info("🔊 SENT to POLLY")
         audio_file = tts_handler.text_to_speech(ai_response)
         polly_end = time.time()
-        logger.info(f"🎵 RECEIVED from POLLY at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} ({polly_end - polly_start:.3f}s)")
+        logger.info(f"🎵 RECEIVED from POLLY ({polly_end - polly_start:.3f}s)")
         
         # Step 3: Generate working FSEQ sequence with XSQ model loading
         sequence_start = time.time()
-        logger.info(f"🎬 SEQUENCE GENERATION START at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
+        logger.info("🎬 SEQUENCE GENERATION START")
         
         # Use the working sequence generation method that preserves all phoneme/face/lighting logic
         # This method loads XSQ files for model configurations but uses proven FSEQ generation
@@ -72,7 +73,7 @@ def process_query():
         xsq_file = sequence_files.get('xsq', 'none')
         
         sequence_end = time.time()
-        logger.info(f"✅ SEQUENCE GENERATION END at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} ({sequence_end - sequence_start:.3f}s)")
+        logger.info(f"✅ SEQUENCE GENERATION END ({sequence_end - sequence_start:.3f}s)")
         
         # Extract file paths
         source_type = 'proven_fseq_generation'
@@ -85,7 +86,7 @@ def process_query():
         # Step 4: Upload to FPP and create playlist (optional)
         fpp_result = None
         if os.getenv("FPP_HOST"):
-            logger.info(f"🎪 FPP UPLOAD START at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
+            logger.info("🎪 FPP UPLOAD START")
             fpp_start = time.time()
             
             # Upload FSEQ and audio to FPP for themed character playback
@@ -129,14 +130,14 @@ def process_query():
                 logger.error(f"❌ FPP UPLOAD FAILED: {fpp_result}")
             
             fpp_end = time.time()
-            logger.info(f"🎪 FPP COMPLETE at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} ({fpp_end - fpp_start:.3f}s)")
+            logger.info(f"🎪 FPP COMPLETE ({fpp_end - fpp_start:.3f}s)")
         else:
             logger.info("🎪 FPP not configured - skipping upload and playlist creation")
         
         total_time = time.time() - start_time
         fpp_time = fpp_end - fpp_start if os.getenv("FPP_HOST") else 0
-        logger.info(f"🏁 TOTAL COMPLETION at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} ({total_time:.3f}s total)")
-        logger.info(f"📊 TIMING BREAKDOWN:")
+        logger.info(f"🏁 TOTAL COMPLETION ({total_time:.3f}s total)")
+        logger.info("📊 TIMING BREAKDOWN:")
         logger.info(f"   - Grok AI: {grok_end - grok_start:.3f}s")
         logger.info(f"   - AWS Polly TTS: {polly_end - polly_start:.3f}s")
         logger.info(f"   - FSEQ Generation: {sequence_end - sequence_start:.3f}s")
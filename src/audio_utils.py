@@ -0,0 +1,161 @@
+"""
+Audio helpers
+MP3 duration from frame headers (no full-file parse) and streaming playback of MP3 chunks
+"""
+
+import os
+import struct
+import subprocess
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# How much of the file (after any ID3v2 tag) to search for the first frame header
+HEADER_SCAN_BYTES = 4096
+
+# Layer III bitrates in kbps by bitrate index (MPEG-1, then MPEG-2/2.5)
+_BITRATES_MPEG1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_BITRATES_MPEG2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+# Sample rates by version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5) and sample rate index
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+
+def mp3_duration(filepath: str) -> Optional[float]:
+    """Get MP3 duration in seconds from the first frame header (and Xing/VBRI tag if present)
+
+    Returns None if no Layer III frame header can be found.
+    """
+    with open(filepath, 'rb') as f:
+        audio_start = _id3v2_size(f.read(10))
+        f.seek(audio_start)
+        data = f.read(HEADER_SCAN_BYTES)
+
+    duration = _scan_duration(data, os.path.getsize(filepath) - audio_start)
+    if duration is None:
+        logger.debug(f"No MP3 frame header found in {filepath}")
+    return duration
+
+
+def mp3_bytes_duration(data: bytes) -> Optional[float]:
+    """Same as mp3_duration, for MP3 data already in memory"""
+    audio_start = _id3v2_size(data[:10])
+    return _scan_duration(data[audio_start:audio_start + HEADER_SCAN_BYTES], len(data) - audio_start)
+
+
+def _scan_duration(data: bytes, audio_size: int) -> Optional[float]:
+    """Find the first frame header in data (the start of the audio) and derive the duration"""
+    for i in range(len(data) - 3):
+        if data[i] != 0xFF or (data[i + 1] & 0xE0) != 0xE0:
+            continue
+
+        header = _parse_frame_header(data[i:i + 4])
+        if not header:
+            continue
+        is_mpeg1, bitrate_kbps, sample_rate, is_mono = header
+        samples_per_frame = 1152 if is_mpeg1 else 576
+
+        # VBR files carry the total frame count in a Xing/Info or VBRI tag in the first frame
+        frame_count = _vbr_frame_count(data, i, is_mpeg1, is_mono)
+        if frame_count:
+            return frame_count * samples_per_frame / sample_rate
+
+        # CBR: duration follows directly from the audio byte count
+        return (audio_size - i) * 8 / (bitrate_kbps * 1000)
+
+    return None
+
+
+def _id3v2_size(head: bytes) -> int:
+    """Size of a leading ID3v2 tag (0 if there is none)"""
+    if len(head) < 10 or head[:3] != b'ID3':
+        return 0
+    # Tag size is a 28-bit "synchsafe" integer (7 bits per byte)
+    size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+    footer = 10 if head[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _parse_frame_header(header: bytes) -> Optional[tuple]:
+    """Decode a 4-byte Layer III frame header into (is_mpeg1, bitrate_kbps, sample_rate, is_mono)"""
+    version_bits = (header[1] >> 3) & 0x03
+    layer_bits = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+
+    # Reserved version, non-Layer III, free/bad bitrate or reserved sample rate
+    if version_bits == 1 or layer_bits != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    is_mpeg1 = version_bits == 3
+    bitrate_kbps = (_BITRATES_MPEG1 if is_mpeg1 else _BITRATES_MPEG2)[bitrate_index]
+    sample_rate = _SAMPLE_RATES[version_bits][sample_rate_index]
+    is_mono = (header[3] >> 6) == 3
+    return is_mpeg1, bitrate_kbps, sample_rate, is_mono
+
+
+def _vbr_frame_count(data: bytes, sync: int, is_mpeg1: bool, is_mono: bool) -> Optional[int]:
+    """Read the frame count from a Xing/Info or VBRI tag in the frame starting at sync"""
+    # Xing/Info sits right after the side information, whose size depends on version/channels
+    if is_mpeg1:
+        side_info = 17 if is_mono else 32
+    else:
+        side_info = 9 if is_mono else 17
+    xing = sync + 4 + side_info
+    if data[xing:xing + 4] in (b'Xing', b'Info') and len(data) >= xing + 12:
+        flags = struct.unpack('>I', data[xing + 4:xing + 8])[0]
+        if flags & 0x01:  # Frames field present
+            return struct.unpack('>I', data[xing + 8:xing + 12])[0]
+
+    # VBRI (Fraunhofer) is always 32 bytes after the header
+    vbri = sync + 36
+    if data[vbri:vbri + 4] == b'VBRI' and len(data) >= vbri + 18:
+        return struct.unpack('>I', data[vbri + 14:vbri + 18])[0]
+
+    return None
+
+
+class AudioStreamer:
+    """Plays MP3 data as it arrives by piping it into an mpg123 subprocess
+
+    Usable as the on_chunk callback of TTSHandler.text_to_speech:
+
+        with AudioStreamer() as player:
+            tts_handler.text_to_speech(text, on_chunk=player)
+    """
+
+    def __init__(self, command: Optional[list] = None):
+        self.command = command or ['mpg123', '-q', '-']
+        self.process = None
+
+    def __call__(self, chunk: bytes):
+        if self.process is None:
+            self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE)
+        try:
+            self.process.stdin.write(chunk)
+            self.process.stdin.flush()
+        except BrokenPipeError:
+            logger.warning("Audio player exited early - dropping remaining audio")
+
+    def close(self):
+        """Signal end of stream and wait for playback to finish"""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        self.process.wait()
+        self.process = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -24,6 +24,13 @@ class ConfigLoader:
                 cls._config = {}
         return cls._config
     
+    @staticmethod
+    def _get_flag(value, env_var: str) -> bool:
+        """Boolean setting: the config value if present, otherwise the environment variable (default false)"""
+        if value is None:
+            value = os.getenv(env_var, 'false')
+        return str(value).lower() == 'true'
+    
     @classmethod
     def get_aws_config(cls):
         """Get AWS configuration with fallback to environment variables"""
@@ -45,5 +52,10 @@ class ConfigLoader:
         return {
             'voice_id': tts_config.get('voice_id') or os.getenv('POLLY_VOICE_ID', 'Joanna'),
             'engine': tts_config.get('engine') or os.getenv('POLLY_ENGINE', 'neural'),
-            'language_code': tts_config.get('language_code') or os.getenv('POLLY_LANGUAGE_CODE', 'en-US')
+            'language_code': tts_config.get('language_code') or os.getenv('POLLY_LANGUAGE_CODE', 'en-US'),
+            'output_s3_bucket': tts_config.get('output_s3_bucket') or os.getenv('POLLY_OUTPUT_BUCKET'),
+            # Skipping the speech-marks request halves Polly calls per utterance, at the
+            # cost of mouth shapes driven by estimated word timing instead of visemes
+            'use_estimated_timing': cls._get_flag(tts_config.get('use_estimated_timing'), 'POLLY_USE_ESTIMATED_TIMING'),
+            'verbose_timing': cls._get_flag(tts_config.get('verbose_timing'), 'TTS_VERBOSE_TIMING')
         }
\ No newline at end of file
@@ -1,14 +1,83 @@
 import os
 import json
+import time
 import struct
 import logging
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from .model_manager import ModelManager
-from .xlights_converter import XLightsConverter
+from .xlights_converter import XLightsConverter, _NODE_RANGE_RE
+
+try:
+    import orjson  # Optional: faster parsing of timings.json
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# faceInfo attributes that describe the face itself rather than a node range
+_FACE_INFO_SKIP_ATTRS = frozenset({'Name', 'CustomColors', 'Type'})
+
+# How long a "latest XSQ/xmodel" lookup is reused while the directory itself is unchanged
+LATEST_FILE_CACHE_TTL = 1.0
+
+@dataclass
+class Timings:
+    """Timing marks as parallel lists (labels/starts/ends) for per-frame lookups
+    
+    Non-overlapping marks are sorted by start and looked up by bisect. If any marks
+    overlap they keep their original order and the lookup scans for the first mark
+    covering the time, as the list-of-dicts lookup always did.
+    """
+    labels: List[str]
+    starts: List[int]
+    ends: List[int]
+    overlapping: bool = False
+    
+    @classmethod
+    def from_marks(cls, marks: List[Dict]) -> 'Timings':
+        """Build from normalized timing dicts (viseme, phoneme or word marks)"""
+        rows = [
+            (m.get('start_time') or m.get('start_ms', 0),
+             m.get('end_time') or m.get('end_ms', 0),
+             m.get('viseme') or m.get('phoneme') or 'sil')
+            for m in marks
+        ]
+        sorted_rows = sorted(rows, key=lambda row: row[0])
+        
+        # Bisect is only exact when no mark starts before an earlier one has ended
+        overlapping = False
+        latest_end = None
+        for start, end, _ in sorted_rows:
+            if latest_end is not None and start < latest_end:
+                overlapping = True
+                break
+            latest_end = end if latest_end is None else max(latest_end, end)
+        if not overlapping:
+            rows = sorted_rows
+        
+        return cls(
+            labels=[label for _, _, label in rows],
+            starts=[start for start, _, _ in rows],
+            ends=[end for _, end, _ in rows],
+            overlapping=overlapping
+        )
+    
+    def current_at(self, time_ms: int) -> int:
+        """Index of the mark active at time_ms, or -1 if none is"""
+        if self.overlapping:
+            for idx, (start, end) in enumerate(zip(self.starts, self.ends)):
+                if start <= time_ms < end:
+                    return idx
+            return -1
+        
+        idx = bisect_right(self.starts, time_ms) - 1
+        if idx >= 0 and time_ms < self.ends[idx]:
+            return idx
+        return -1
+
 class SequenceGenerator:
     """Generate FSEQ sequences for FPP from phoneme timing data"""
     
@@ -16,50 +85,72 @@ class SequenceGenerator:
         self.output_dir = "output"
         self.model_manager = ModelManager()
         self.xlights_converter = XLightsConverter()
+        self._latest_file_cache = {}  # (dir, suffix) -> (expires_at, dir mtime_ns, path)
         self.template_xsq = self._find_latest_xsq()  # Find most recent XSQ
         self.xmodel_file = self._find_latest_xmodel()  # Find most recent xmodel
         self.face_elements = {}  # Will store extracted face elements from template
+        self._timings_cache = None  # ((mtime_ns, size), parsed timings.json)
         self._load_face_elements()
+        self._face_source = self._get_face_source()  # xmodel/XSQ the face elements came from
         os.makedirs(self.output_dir, exist_ok=True)
     
     def _find_latest_xsq(self) -> str:
         """Find the most recently modified XSQ file in active_models"""
-        xsq_dir = "models/active_models"
-        if not os.path.exists(xsq_dir):
-            logger.warning(f"XSQ directory not found: {xsq_dir}")
-            return None
-        
-        xsq_files = [f for f in os.listdir(xsq_dir) if f.endswith('.xsq')]
-        if not xsq_files:
-            logger.warning(f"No XSQ files found in {xsq_dir}")
-            return None
-        
-        # Get the MOST RECENTLY MODIFIED XSQ (newest timestamp)
-        latest = max(xsq_files, key=lambda f: os.path.getmtime(os.path.join(xsq_dir, f)))
-        full_path = os.path.join(xsq_dir, latest)
-        mtime = os.path.getmtime(full_path)
-        logger.info(f"✅ Found latest XSQ: {latest} (modified: {datetime.fromtimestamp(mtime)})")
-        return full_path
+        return self._find_latest_file("models/active_models", '.xsq', "XSQ")
     
     def _find_latest_xmodel(self) -> str:
         """Find the most recently modified xmodel file in active_models"""
-        xmodel_dir = "models/active_models"
-        if not os.path.exists(xmodel_dir):
-            logger.warning(f"xmodel directory not found: {xmodel_dir}")
+        return self._find_latest_file("models/active_models", '.xmodel', "xmodel")
+    
+    def _find_latest_file(self, directory: str, suffix: str, label: str) -> str:
+        """Most recently modified file with the given suffix, reused for LATEST_FILE_CACHE_TTL seconds
+        
+        Adding, removing or renaming a file changes the directory mtime and invalidates
+        the cached answer straight away; call clear_cache() after rewriting one in place.
+        """
+        try:
+            dir_mtime_ns = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            logger.warning(f"{label} directory not found: {directory}")
             return None
         
-        xmodel_files = [f for f in os.listdir(xmodel_dir) if f.endswith('.xmodel')]
-        if not xmodel_files:
-            logger.warning(f"No xmodel files found in {xmodel_dir}")
+        cache_key = (directory, suffix)
+        cached = self._latest_file_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic() and cached[1] == dir_mtime_ns:
+            return cached[2]
+        
+        # Get the MOST RECENTLY MODIFIED file (newest timestamp), one stat per file
+        latest, latest_mtime = None, -1.0
+        with os.scandir(directory) as it:
+            for entry in it:
+                # Skip dotfiles (editor/OS leftovers) and directories; is_file() uses d_type, no stat
+                if entry.name.startswith('.') or not entry.name.endswith(suffix) or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest, latest_mtime = entry.name, mtime
+        
+        if latest is None:
+            logger.warning(f"No {label} files found in {directory}")
             return None
         
-        # Get the MOST RECENTLY MODIFIED xmodel (newest timestamp)
-        latest = max(xmodel_files, key=lambda f: os.path.getmtime(os.path.join(xmodel_dir, f)))
-        full_path = os.path.join(xmodel_dir, latest)
-        mtime = os.path.getmtime(full_path)
-        logger.info(f"✅ Found latest xmodel: {latest} (modified: {datetime.fromtimestamp(mtime)})")
+        full_path = os.path.join(directory, latest)
+        logger.info(f"✅ Found latest {label}: {latest} (modified: {datetime.fromtimestamp(latest_mtime)})")
+        self._latest_file_cache[cache_key] = (time.monotonic() + LATEST_FILE_CACHE_TTL, dir_mtime_ns, full_path)
         return full_path
     
+    def clear_cache(self):
+        """Forget cached latest-file lookups (e.g. after an XSQ/xmodel was rewritten in place)"""
+        self._latest_file_cache.clear()
+    
+    def _get_face_source(self) -> tuple:
+        """Return the xmodel/XSQ paths with their mtimes, used to detect when a reload is needed"""
+        source = []
+        for path in (self.xmodel_file, self.template_xsq):
+            mtime = os.path.getmtime(path) if path and os.path.exists(path) else None
+            source.append((path, mtime))
+        return tuple(source)
+    
     def _load_face_elements(self):
         """Load ALL face elements dynamically from model - both definitions and colors"""
         try:
@@ -80,15 +171,13 @@ class SequenceGenerator:
             
             # Load face element definitions from xmodel
             for face_info in root.findall('.//faceInfo'):
-                for attr_name in face_info.attrib:
-                    if attr_name.endswith('-Color') or attr_name.endswith('2-Color') or attr_name.endswith('3-Color'):
-                        continue
-                    if attr_name in ['Name', 'CustomColors', 'Type']:
+                attrs = face_info.attrib
+                for attr_name, nodes_str in attrs.items():
+                    # '2-Color' / '3-Color' variants also end with '-Color'
+                    if attr_name.endswith('-Color') or attr_name in _FACE_INFO_SKIP_ATTRS:
                         continue
                     
-                    nodes_str = face_info.get(attr_name, '')
-                    color_attr = attr_name + '-Color'
-                    color_hex = face_info.get(color_attr, '#FFFFFF')
+                    color_hex = attrs.get(attr_name + '-Color', '#FFFFFF')
                     
                     if nodes_str:
                         tag = attr_name
@@ -200,11 +289,16 @@ class SequenceGenerator:
     def create_sequence(self, text: str, audio_file: str, filename: str = None) -> Dict[str, str]:
         """Create FSEQ sequence file from text and audio"""
         try:
-            # ALWAYS reload the latest model and XSQ when creating a new sequence
+            # Pick up the latest model and XSQ; only reparse when one of them changed
             self.template_xsq = self._find_latest_xsq()
             self.xmodel_file = self._find_latest_xmodel()
-            self.face_elements = {}  # Clear and reload
-            self._load_face_elements()
+            face_source = self._get_face_source()
+            if face_source != self._face_source:
+                self.face_elements = {}  # Clear and reload
+                self._load_face_elements()
+                self._face_source = face_source
+            else:
+                logger.info("Model and XSQ unchanged - reusing loaded face elements")
             
             # Extract timestamp from audio file to match naming
             if not filename and audio_file:
@@ -263,6 +357,11 @@ class SequenceGenerator:
             fpp_start_channel = model_info.get('start_channel', 1)
             channel_count = model_info.get('channel_count', 450)
             
+            # Face info is the same for every frame - look it up once
+            face_info = model_info.get('face_info', {})
+            if not face_info:
+                logger.warning(f"No face_info found for model {model_name}")
+            
             # FSEQ must include all channels up to the last used channel
             # If model uses channels 1-450, FSEQ has 450 channels
             # If model uses channels 860-1309, FSEQ has 1309 channels
@@ -281,11 +380,8 @@ class SequenceGenerator:
             
             num_frames = max(1, (duration_ms + frame_duration_ms - 1) // frame_duration_ms)
             
-            # Generate frame data
-            frame_data = []
-            for frame_idx in range(num_frames):
-                frame = self._generate_phoneme_frame(frame_idx, frame_duration_ms, word_timings, total_channels, model_start_offset)
-                frame_data.append(bytes(frame))
+            # Timings as start/end lists (sorted for bisect lookups unless marks overlap)
+            timings = Timings.from_marks(word_timings or [])
             
             # Write FSEQ v2.0 file with proper header
             with open(fseq_filepath, 'wb') as f:
@@ -314,41 +410,35 @@ class SequenceGenerator:
                 
                 f.write(bytes(header))
                 
-                for frame in frame_data:
+                # Generate frame data into one reused buffer, written straight to the file
+                frame = bytearray(total_channels)
+                blank_frame = bytes(total_channels)
+                for frame_idx in range(num_frames):
+                    frame[:] = blank_frame
+                    self._generate_phoneme_frame(frame, frame_idx, frame_duration_ms, timings, face_info, model_start_offset)
                     f.write(frame)
                 
-            logger.info(f"Created FSEQ v2.0 file: {fseq_filepath} ({len(frame_data)} frames, {total_channels} channels)")
+            logger.info(f"Created FSEQ v2.0 file: {fseq_filepath} ({num_frames} frames, {total_channels} channels)")
             
             
         except Exception as e:
             logger.error(f"Error creating FSEQ file: {str(e)}")
             raise
 
-    def _generate_phoneme_frame(self, frame_idx: int, frame_duration_ms: int, word_timings: List[Dict], num_channels: int, model_start_offset: int = 0) -> bytearray:
-        """Generate animation frame with ALL face elements + phoneme-based mouth animation"""
+    def _generate_phoneme_frame(self, frame: bytearray, frame_idx: int, frame_duration_ms: int, timings: Timings, face_info: Dict[str, Any], model_start_offset: int = 0):
+        """Render ALL face elements + phoneme-based mouth animation into a zeroed frame buffer"""
         current_time_ms = frame_idx * frame_duration_ms
-        frame = bytearray(num_channels)
-        
-        # Get active model and its face info
-        active_models = self.model_manager.get_active_models()
-        if not active_models:
-            return frame
-        
-        # Use the first active model
-        model_name = list(active_models.keys())[0]
-        model_info = active_models[model_name]
-        face_info = model_info.get('face_info', {})
+        num_channels = len(frame)
         
         if not face_info:
-            logger.warning(f"No face_info found for model {model_name}")
-            return frame
+            return
         
         # FIRST: Light up all the STATIC face elements (eyes, nose, outline, antlers, etc)
         # These are extracted from the template XSQ and should be on in every frame
         self._apply_all_static_face_elements(frame, model_start_offset)
         
         # SECOND: Apply mouth shape based on current viseme (Polly timing marks)
-        current_viseme = self._get_phoneme_at_time(current_time_ms, word_timings)
+        current_viseme = self._get_phoneme_at_time(current_time_ms, timings)
         mouth_shapes = face_info.get('mouth_shapes', {})
         mouth_shape_name = self._map_viseme_to_mouth_shape(current_viseme)
         
@@ -369,8 +459,6 @@ class SequenceGenerator:
                     frame[rgb_start] = color[0]      # R
                     frame[rgb_start + 1] = color[1]  # G
                     frame[rgb_start + 2] = color[2]  # B
-        
-        return frame
     
     def _apply_all_static_face_elements(self, frame: bytearray, model_start_offset: int = 0):
         """Light up all static face elements from template with colors from XSQ"""
@@ -406,40 +494,22 @@ class SequenceGenerator:
     
     def _parse_node_ranges(self, node_string: str) -> List[int]:
         """Parse node range string like '1-5,10,15-20' into list of node numbers"""
-        nodes = []
         if not node_string:
-            return nodes
+            return []
         
-        parts = node_string.split(',')
-        for part in parts:
-            part = part.strip()
-            if '-' in part:
-                # Range like '1-5'
-                start, end = part.split('-')
-                try:
-                    nodes.extend(range(int(start), int(end) + 1))
-                except ValueError:
-                    continue
+        nodes = set()
+        for start, end in _NODE_RANGE_RE.findall(node_string):
+            if end:
+                nodes.update(range(int(start), int(end) + 1))
             else:
-                # Single node
-                try:
-                    nodes.append(int(part))
-                except ValueError:
-                    continue
+                nodes.add(int(start))
         
-        return sorted(list(set(nodes)))  # Remove duplicates and sort
+        return sorted(nodes)  # Remove duplicates and sort
 
-    def _get_phoneme_at_time(self, time_ms: int, word_timings: List[Dict]) -> str:
+    def _get_phoneme_at_time(self, time_ms: int, timings: Timings) -> str:
         """Get the active phoneme/viseme at a specific time"""
-        for timing_data in word_timings:
-            start = timing_data.get('start_time') or timing_data.get('start_ms', 0)
-            end = timing_data.get('end_time') or timing_data.get('end_ms', 0)
-            
-            if start <= time_ms < end:
-                # Return viseme if available (from Polly), otherwise phoneme
-                return timing_data.get('viseme') or timing_data.get('phoneme') or timing_data.get('viseme', 'sil')
-        
-        return "sil"
+        idx = timings.current_at(time_ms)
+        return timings.labels[idx] if idx >= 0 else "sil"
     
     def _map_viseme_to_mouth_shape(self, viseme: str) -> str:
         """Map Polly AWS viseme to xLights mouth shape"""
@@ -476,9 +546,8 @@ class SequenceGenerator:
         try:
             timings_file = os.path.join(self.output_dir, "timings.json")
             if os.path.exists(timings_file):
-                with open(timings_file, 'r') as f:
-                    timings_data = json.load(f)
-                    
+                timings_data = self._read_timings_file(timings_file)
+                
                 # Check if it's a list of timing marks (from Polly) - this is what we need!
                 if isinstance(timings_data, list) and len(timings_data) > 0:
                     first_item = timings_data[0]
@@ -508,6 +577,20 @@ class SequenceGenerator:
             logger.warning(f"Error loading timings: {str(e)}")
             return self._generate_word_timings(text)
 
+    def _read_timings_file(self, timings_file: str) -> Any:
+        """Parse timings.json, reusing the last result while the file is unchanged"""
+        stat = os.stat(timings_file)
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if self._timings_cache and self._timings_cache[0] == cache_key:
+            return self._timings_cache[1]
+        
+        with open(timings_file, 'rb') as f:
+            raw = f.read()
+        timings_data = orjson.loads(raw) if orjson else json.loads(raw)
+        
+        self._timings_cache = (cache_key, timings_data)
+        return timings_data
+
     def _timings_match_text(self, timings: List[Dict], current_words: List[str]) -> bool:
         """Check if cached timings match the current text"""
         if not timings or not current_words:
@@ -1,15 +1,132 @@
 import os
+import re
 import json
+import time
+import shutil
+import hashlib
+import tempfile
 import logging
-import boto3
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 from datetime import datetime
+from typing import Callable, Iterator, Optional
 from botocore.exceptions import NoCredentialsError, BotoCoreError
-from mutagen.mp3 import MP3
+from .audio_utils import mp3_duration, mp3_bytes_duration
 from .config_loader import ConfigLoader
 
+try:
+    import orjson  # Optional: faster parsing of speech marks
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Longest text Polly accepts in a synchronous SynthesizeSpeech request
+SYNC_TEXT_LIMIT = 3000
+# Read size for Polly audio streams (64KB, about one TCP receive window)
+STREAM_CHUNK_SIZE = 64 * 1024
+# Cache of previously synthesized audio + timings, under the output directory
+TTS_CACHE_DIR = 'cache'
+# Most entries kept in the TTS cache; the least recently used are evicted beyond this
+TTS_CACHE_MAX_ENTRIES = 200
+# S3 key prefix for StartSpeechSynthesisTask output
+TASK_KEY_PREFIX = 'tts/'
+# File extension Polly gives task output, by OutputFormat (others use the format name)
+_TASK_OUTPUT_EXTENSIONS = {'json': 'marks', 'ogg_vorbis': 'ogg'}
+# Give up on a synthesis task that hasn't finished after this many seconds
+SYNTHESIS_TASK_TIMEOUT = 300
+# Client-side Polly request limits (well under the account's server-side TPS limit)
+POLLY_MAX_RPS = 10
+POLLY_MAX_CONCURRENCY = 4
+# Total attempts per call; botocore's adaptive retry mode backs off on throttling (and rate-limits itself)
+POLLY_MAX_ATTEMPTS = 5
+# The voice catalog rarely changes - reuse describe_voices results for an hour
+VOICES_CACHE_TTL = 3600
+# Streaming synthesis: text is cut into sentence batches of at most this many characters,
+# with a few batches synthesized ahead of the one being played
+STREAM_CHUNK_CHARS = 1400
+STREAM_MAX_WORKERS = 3
+
+# Sentence and clause boundaries used when chunking text for streaming
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+_CLAUSE_END_RE = re.compile(r'(?<=[,;:])\s+')
+
+class _PollyLimiter:
+    """Spaces Polly API calls to a maximum rate and caps how many are in flight"""
+    
+    def __init__(self, rps: float, concurrency: int):
+        self.semaphore = threading.Semaphore(concurrency)
+        self.min_interval = 1.0 / rps
+        self.lock = threading.Lock()
+        self.last_call = 0.0
+    
+    def __enter__(self):
+        with self.lock:
+            wait = self.min_interval - (time.monotonic() - self.last_call)
+            if wait > 0:
+                time.sleep(wait)
+            self.last_call = time.monotonic()
+        self.semaphore.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.semaphore.release()
+        return False
+
+def _drop_page_cache(filepath: str):
+    """Hint the kernel to evict a file's pages (no-op where posix_fadvise is unavailable)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        # DONTNEED skips dirty pages, so a freshly written file has to reach the disk first
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+# Process umask, read once: mkstemp files are 0600 and need normal permissions before they replace
+# timings.json (the display process may run as another user)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _atomic_write(path: str, data: bytes):
+    """Write data to path through a unique temp file in the same directory, then rename it into place"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _pack_pieces(pieces: list, max_chars: int) -> list:
+    """Greedily join text pieces with spaces into chunks of at most max_chars"""
+    chunks = []
+    current = ''
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
 class TTSHandler:
+    # Shared by all handlers so the limits hold process-wide
+    _limiter = _PollyLimiter(POLLY_MAX_RPS, POLLY_MAX_CONCURRENCY)
+    # (engine, language_code) -> (expires_at, describe_voices response)
+    _voices_cache = {}
+    # (service, region, credentials hash) -> boto3 client, so handlers share one connection pool
+    _clients = {}
+    _clients_lock = threading.Lock()
+    
     def __init__(self):
         # Load configuration from config.yaml with environment variable fallbacks
         aws_config = ConfigLoader.get_aws_config()
@@ -18,28 +135,79 @@ class TTSHandler:
         self.voice_id = tts_config['voice_id']
         self.engine = tts_config['engine']
         self.language_code = tts_config['language_code']
+        self.output_bucket = tts_config['output_s3_bucket']  # Only needed for long text
+        self.use_estimated_timing = tts_config['use_estimated_timing']
+        self.verbose_timing = tts_config['verbose_timing']  # Per-chunk download telemetry
         self.output_dir = "output"
         
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
         
-        # Initialize Polly client
+        # Background worker for Polly requests that run alongside audio synthesis
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='polly')
+        
+        # Initialize Polly client (shared with other handlers using the same credentials)
         try:
-            self.polly = boto3.client(
-                'polly',
-                region_name=aws_config['region'],
-                aws_access_key_id=aws_config['access_key_id'],
-                aws_secret_access_key=aws_config['secret_access_key']
-            )
+            self.polly = self._get_client('polly', aws_config)
+            self.s3 = self._get_client('s3', aws_config) if self.output_bucket else None
             logger.info(f"Amazon Polly client initialized successfully - Voice: {self.voice_id}, Engine: {self.engine}")
+            
+            # Open the pooled HTTPS connection now so the first synthesis doesn't pay the TLS handshake
+            self._executor.submit(self._warm_connection)
         except (NoCredentialsError, Exception) as e:
             logger.error(f"Failed to initialize Polly client: {str(e)}")
             raise
 
-    def text_to_speech(self, text: str, filename: str = None) -> str:
-        """Convert text to speech and save as MP3 with word timing data"""
-        import time
+    @classmethod
+    def _get_client(cls, service: str, aws_config: dict):
+        """Return the shared boto3 client for a service, creating it on first use"""
+        credentials = f"{aws_config['access_key_id']}:{aws_config['secret_access_key']}"
+        key = (service, aws_config['region'], hashlib.sha256(credentials.encode('utf-8')).hexdigest())
+        with cls._clients_lock:
+            client = cls._clients.get(key)
+            if client is None:
+                # boto3 is imported here rather than at module load - it pulls in most of
+                # botocore, which users of the timing helpers don't need
+                import boto3
+                from botocore.config import Config
+                
+                # Short timeouts + TCP keepalive so a silently dropped pooled connection fails
+                # fast instead of stalling the first request for the 60s SDK default
+                client_config = Config(
+                    connect_timeout=5,
+                    read_timeout=15,
+                    retries={'max_attempts': POLLY_MAX_ATTEMPTS, 'mode': 'adaptive'},
+                    max_pool_connections=10,
+                    tcp_keepalive=True
+                )
+                client = boto3.client(
+                    service,
+                    config=client_config,
+                    region_name=aws_config['region'],
+                    aws_access_key_id=aws_config['access_key_id'],
+                    aws_secret_access_key=aws_config['secret_access_key']
+                )
+                cls._clients[key] = client
+            return client
+
+    def _warm_connection(self):
+        """Make a cheap Polly call (describe_voices, which also fills the voice cache) to prime the connection pool"""
+        try:
+            self._describe_voices()
+        except Exception as e:
+            logger.debug(f"Polly connection warm-up failed: {e}")
+
+    def _call_polly(self, operation: str, **kwargs) -> dict:
+        """Call a Polly API operation through the rate limiter (throttling retries are left to botocore)"""
+        with self._limiter:
+            return getattr(self.polly, operation)(**kwargs)
+
+    def text_to_speech(self, text: str, filename: str = None, on_chunk: Optional[Callable[[bytes], None]] = None) -> str:
+        """Convert text to speech and save as MP3 with word timing data
         
+        If on_chunk is given it is called with each block of MP3 data as it arrives,
+        so playback can start before the whole file is downloaded.
+        """
         try:
             if not filename:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -50,94 +218,52 @@ class TTSHandler:
             
             filepath = os.path.join(self.output_dir, filename)
             
-            polly_synthesis_start = time.time()
+            # Identical text/voice/engine requests are served from the local cache
+            cache_key = self._cache_key(text)
+            if self._restore_from_cache(cache_key, filepath):
+                if on_chunk:
+                    self._emit_file_chunks(filepath, on_chunk)
+                return filepath
             
             logger.info(f"Generating TTS with Polly for {len(text)} characters")
             
-            # Generate speech marks for timing data (only supported by neural/standard engines)
-            timing_data = []
-            if self.engine in ['neural', 'standard']:
-                try:
-                    timing_response = self.polly.synthesize_speech(
-                        Text=text,
-                        OutputFormat='json',
-                        VoiceId=self.voice_id,
-                        Engine=self.engine,
-                        LanguageCode=self.language_code,
-                        SpeechMarkTypes=['viseme', 'word']  # Get viseme AND word timing (viseme covers full audio)
-                    )
-                    timing_data = self._process_speech_marks(timing_response['AudioStream'].read())
-                    logger.info(f"Retrieved {len(timing_data)} timing marks from Polly")
-                except Exception as e:
-                    logger.warning(f"Could not get speech marks from Polly: {e}")
-                    timing_data = []
+            # Speech marks (only supported by neural/standard engines) and audio are
+            # independent requests, so fetch the marks in the background
+            marks_future = None
+            if self.use_estimated_timing:
+                logger.info("Speech marks disabled (use_estimated_timing), will use estimated timing")
+            elif self.engine in ['neural', 'standard']:
+                marks_future = self._executor.submit(self._fetch_speech_marks, text)
             else:
                 logger.info(f"Speech marks not supported for engine '{self.engine}', will use estimated timing")
             
-            # Convert to speech with Polly
-            logger.info(f"🔊 POLLY SYNTHESIS START at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
-            audio_response = self.polly.synthesize_speech(
-                Text=text,
-                OutputFormat='mp3',
-                VoiceId=self.voice_id,
-                Engine=self.engine,
-                LanguageCode=self.language_code
-            )
-            polly_synthesis_end = time.time()
-            logger.info(f"🔊 POLLY SYNTHESIS END at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} ({polly_synthesis_end - polly_synthesis_start:.3f}s)")
-            
-            # Save audio stream to file with detailed timing
-            download_start = time.time()
-            logger.info(f"⬇️ POLLY DOWNLOAD START at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
-            
-            # Read in chunks to detect when bytes actually start flowing
-            audio_stream = audio_response['AudioStream']
-            audio_content = b''
-            first_byte_time = None
-            chunk_size = 8192  # 8KB chunks
-            
-            while True:
-                try:
-                    chunk = audio_stream.read(chunk_size)
-                    if not chunk:
-                        break
-                    
-                    if first_byte_time is None:
-                        first_byte_time = time.time()
-                        logger.info(f"🟢 FIRST BYTES RECEIVED at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} ({first_byte_time - download_start:.3f}s delay)")
-                    
-                    audio_content += chunk
-                    
-                except Exception as e:
-                    logger.error(f"Error reading audio stream chunk: {e}")
-                    break
-            
-            download_end = time.time()
-            logger.info(f"⬇️ POLLY DOWNLOAD END at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} ({download_end - download_start:.3f}s total, {len(audio_content)} bytes)")
-            
-            if first_byte_time:
-                actual_transfer_time = download_end - first_byte_time
-                bytes_per_sec = len(audio_content) / actual_transfer_time if actual_transfer_time > 0 else 0
-                logger.info(f"📊 TRANSFER STATS: {actual_transfer_time:.3f}s transfer, {bytes_per_sec/1024:.1f} KB/s, {first_byte_time - download_start:.3f}s wait time")
+            # Convert to speech with Polly - long text goes through an async S3 task
+            if self._use_synthesis_task(text):
+                audio_response = self._synthesize_long(text, filepath)
+                if on_chunk:
+                    self._emit_file_chunks(filepath, on_chunk)
+            else:
+                audio_response = self._synthesize_to_file(text, filepath, on_chunk)
             
-            file_write_start = time.time()
-            with open(filepath, 'wb') as file:
-                file.write(audio_content)
-            file_write_end = time.time()
-            logger.info(f"💾 FILE WRITE at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} ({file_write_end - file_write_start:.3f}s)")
+            timing_data = marks_future.result() if marks_future else []
+            # Only complete results are cached: marks that were asked for but failed leave
+            # estimated timings, and the next identical request should try Polly again
+            cacheable = not (marks_future and not timing_data)
             
-            # Get actual MP3 duration using mutagen (most accurate)
-            mutagen_start = time.time()
-            logger.info(f"🎧 MUTAGEN START at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
+            # Get actual MP3 duration from the frame headers (no full-file parse)
+            duration_start = time.time()
+            logger.info("🎧 DURATION SCAN START")
             actual_duration = None
             try:
-                audio_file = MP3(filepath)
-                actual_duration = audio_file.info.length
-                mutagen_end = time.time()
-                logger.info(f"🎧 MUTAGEN END at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} ({mutagen_end - mutagen_start:.3f}s) - Duration: {actual_duration:.2f}s")
+                actual_duration = mp3_duration(filepath)
+                if actual_duration is None:
+                    cacheable = False
+                    raise ValueError("no MP3 frame header found")
+                duration_end = time.time()
+                logger.info(f"🎧 DURATION SCAN END ({duration_end - duration_start:.3f}s) - Duration: {actual_duration:.2f}s")
             except Exception as e:
-                mutagen_end = time.time()
-                logger.warning(f"🎧 MUTAGEN FAILED at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} ({mutagen_end - mutagen_start:.3f}s): {e}")
+                duration_end = time.time()
+                logger.warning(f"🎧 DURATION SCAN FAILED ({duration_end - duration_start:.3f}s): {e}")
                 
                 # Fallback 1: Use speech marks if available and complete
                 if timing_data and len(timing_data) > 0:
@@ -173,30 +299,359 @@ class TTSHandler:
                         logger.info(f"Adjusting last viseme from {last_timing['end_ms']}ms to {actual_duration_ms}ms to match audio duration")
                         last_timing['end_ms'] = actual_duration_ms
                 
-                timings_filepath = os.path.join(self.output_dir, "timings.json")
-                with open(timings_filepath, 'w') as f:
-                    json.dump(timing_data, f, indent=2)
+                timings_filepath = self._write_timings(timing_data)
                 logger.info(f"Polly timing data saved to: {timings_filepath}")
             else:
                 # Create estimated timing data with correct duration
                 words = text.split()
                 if words:
                     estimated_timing = self._create_estimated_timing(words, actual_duration)
-                    timings_filepath = os.path.join(self.output_dir, "timings.json")
-                    with open(timings_filepath, 'w') as f:
-                        json.dump(estimated_timing, f, indent=2)
+                    timings_filepath = self._write_timings(estimated_timing)
                     logger.info(f"Created estimated timing data with duration {actual_duration:.2f}s: {timings_filepath}")
                 else:
                     logger.warning("No words found in text for timing generation")
             
             logger.info(f"TTS audio saved to: {filepath}")
             logger.info(f"Timing data saved to: {timings_filepath}")
+            if cacheable:
+                self._store_in_cache(cache_key, filepath)
+            else:
+                logger.info("Not caching TTS result (speech marks or duration scan failed)")
             return filepath
             
         except (BotoCoreError, Exception) as e:
             logger.error(f"Error generating TTS with Polly: {str(e)}")
             raise
 
+    def text_to_speech_stream(self, text: str) -> Iterator[tuple]:
+        """Synthesize text in sentence batches, yielding (mp3_bytes, timings) for each in order
+
+        Later batches are synthesized while earlier ones are being consumed, so playback
+        can start after the first sentence instead of after the whole text. Timings are
+        relative to the start of their own batch.
+        """
+        chunks = self._split_into_chunks(text)
+        logger.info(f"Streaming TTS for {len(text)} characters in {len(chunks)} chunks")
+
+        executor = ThreadPoolExecutor(max_workers=STREAM_MAX_WORKERS, thread_name_prefix='polly-stream')
+        try:
+            # Futures are consumed in submission order, which doubles as the reorder buffer
+            futures = [executor.submit(self._synthesize_chunk, chunk) for chunk in chunks]
+            for future in futures:
+                yield future.result()
+        finally:
+            # Consumer stopped early (or a chunk failed) - don't synthesize the rest
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _split_into_chunks(self, text: str, max_chars: int = STREAM_CHUNK_CHARS) -> list:
+        """Split text on sentence boundaries into chunks of at most max_chars
+
+        Sentences longer than max_chars are broken at commas/semicolons, then at spaces.
+        """
+        pieces = []
+        for sentence in _SENTENCE_END_RE.split(text.strip()):
+            if len(sentence) <= max_chars:
+                pieces.append(sentence)
+                continue
+            for clause in _CLAUSE_END_RE.split(sentence):
+                pieces.extend([clause] if len(clause) <= max_chars else textwrap.wrap(clause, max_chars))
+        return _pack_pieces(pieces, max_chars)
+
+    def _synthesize_chunk(self, text: str) -> tuple:
+        """Synthesize one streaming chunk in memory, returning (mp3_bytes, timings)"""
+        marks_future = None
+        if not self.use_estimated_timing and self.engine in ['neural', 'standard']:
+            marks_future = self._executor.submit(self._fetch_speech_marks, text)
+
+        audio_response = self._call_polly(
+            'synthesize_speech',
+            Text=text,
+            OutputFormat='mp3',
+            VoiceId=self.voice_id,
+            Engine=self.engine,
+            LanguageCode=self.language_code
+        )
+        audio_data = audio_response['AudioStream'].read()
+        timing_data = marks_future.result() if marks_future else []
+
+        duration = mp3_bytes_duration(audio_data) or len(text) / 16.4
+        duration_ms = int(max(1.0, duration) * 1000)
+        if not timing_data:
+            return audio_data, self._create_estimated_timing(text.split(), max(1.0, duration))
+
+        if timing_data[-1]['end_ms'] > duration_ms:
+            timing_data[-1]['end_ms'] = duration_ms
+        return audio_data, timing_data
+
+    def _write_timings(self, timing_data: list) -> str:
+        """Write compact timings.json atomically (readers never see a partial file); returns its path"""
+        timings_filepath = os.path.join(self.output_dir, "timings.json")
+        data = orjson.dumps(timing_data) if orjson else json.dumps(timing_data, separators=(',', ':')).encode('utf-8')
+        _atomic_write(timings_filepath, data)
+        return timings_filepath
+
+    def _cache_key(self, text: str) -> str:
+        """Content hash identifying a TTS request"""
+        request = f"{self.voice_id}|{self.engine}|{self.language_code}|{self.use_estimated_timing}|{text}"
+        return hashlib.sha256(request.encode('utf-8')).hexdigest()
+
+    def _cache_paths(self, cache_key: str) -> tuple:
+        """Return the cached (mp3, timings) paths for a cache key"""
+        cache_dir = os.path.join(self.output_dir, TTS_CACHE_DIR, cache_key[:2])
+        return os.path.join(cache_dir, f"{cache_key}.mp3"), os.path.join(cache_dir, f"{cache_key}.timings.json")
+
+    def _restore_from_cache(self, cache_key: str, filepath: str) -> bool:
+        """Copy a cached MP3 and its timing data into place; returns False on a cache miss"""
+        cached_audio, cached_timings = self._cache_paths(cache_key)
+        if not (os.path.exists(cached_audio) and os.path.exists(cached_timings)):
+            return False
+        
+        try:
+            shutil.copyfile(cached_audio, filepath)
+            with open(cached_timings, 'rb') as f:
+                _atomic_write(os.path.join(self.output_dir, "timings.json"), f.read())
+            os.utime(cached_timings)  # Mark as recently used for eviction
+            logger.info(f"♻️ TTS CACHE HIT ({cache_key[:12]}) - audio restored to: {filepath}")
+            return True
+        except OSError as e:
+            logger.warning(f"Could not restore TTS from cache: {e}")
+            return False
+
+    def _store_in_cache(self, cache_key: str, filepath: str):
+        """Save a freshly generated MP3 and timings.json in the TTS cache (written in the background)"""
+        timings_filepath = os.path.join(self.output_dir, "timings.json")
+        if not os.path.exists(timings_filepath):
+            return
+        
+        # Snapshot both files now (they are still in the page cache) - output files get rewritten
+        # in place later - and leave the cache writes, disk sync and pruning off the request thread
+        try:
+            with open(timings_filepath, 'rb') as f:
+                timings_data = f.read()
+            with open(filepath, 'rb') as f:
+                audio_data = f.read()
+        except OSError as e:
+            logger.warning(f"Could not store TTS in cache: {e}")
+            return
+        self._executor.submit(self._write_cache_entry, cache_key, audio_data, timings_data)
+
+    def _write_cache_entry(self, cache_key: str, audio_data: bytes, timings_data: bytes):
+        """Write one cache entry, then evict old ones (runs on the background executor)"""
+        cached_audio, cached_timings = self._cache_paths(cache_key)
+        try:
+            os.makedirs(os.path.dirname(cached_audio), exist_ok=True)
+            with open(cached_audio, 'wb') as f:
+                f.write(audio_data)
+            _atomic_write(cached_timings, timings_data)  # Entry is complete once the sidecar exists
+            # Cached copies stay cold until a repeat request - keep them out of the page cache
+            _drop_page_cache(cached_audio)
+            self._prune_cache()
+        except OSError as e:
+            logger.warning(f"Could not store TTS in cache: {e}")
+
+    def _prune_cache(self, max_entries: int = TTS_CACHE_MAX_ENTRIES):
+        """Evict the least recently used cache entries beyond max_entries (hits refresh the sidecar mtime)"""
+        entries = []
+        cache_root = os.path.join(self.output_dir, TTS_CACHE_DIR)
+        with os.scandir(cache_root) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as files:
+                    for entry in files:
+                        if entry.name.endswith('.timings.json'):
+                            entries.append((entry.stat().st_mtime, entry.name[:-len('.timings.json')]))
+        
+        if len(entries) <= max_entries:
+            return
+        entries.sort()
+        for _, cache_key in entries[:len(entries) - max_entries]:
+            for path in reversed(self._cache_paths(cache_key)):  # Sidecar first - it marks the entry complete
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        logger.info(f"TTS cache pruned to {max_entries} entries")
+
+    def _synthesize_to_file(self, text: str, filepath: str, on_chunk: Optional[Callable[[bytes], None]] = None) -> dict:
+        """Synthesize MP3 audio with a synchronous Polly request, streaming it to filepath"""
+        polly_synthesis_start = time.time()
+        logger.info("🔊 POLLY SYNTHESIS START")
+        audio_response = self._call_polly(
+            'synthesize_speech',
+            Text=text,
+            OutputFormat='mp3',
+            VoiceId=self.voice_id,
+            Engine=self.engine,
+            LanguageCode=self.language_code
+        )
+        polly_synthesis_end = time.time()
+        logger.info(f"🔊 POLLY SYNTHESIS END ({polly_synthesis_end - polly_synthesis_start:.3f}s)")
+        
+        # Save audio stream to file with detailed timing
+        download_start = time.time()
+        logger.info("⬇️ POLLY DOWNLOAD START")
+        
+        audio_stream = audio_response['AudioStream']
+        
+        # Fast path: nothing needs per-chunk hooks, so let copyfileobj do the loop
+        if on_chunk is None and not self.verbose_timing:
+            with open(filepath, 'wb') as file:
+                shutil.copyfileobj(audio_stream, file, STREAM_CHUNK_SIZE)
+            logger.info(f"⬇️ POLLY DOWNLOAD END ({time.time() - download_start:.3f}s total)")
+            return audio_response
+        
+        # Stream chunks straight to disk (also detects when bytes actually start flowing)
+        bytes_written = 0
+        first_byte_time = None
+        chunk_size = STREAM_CHUNK_SIZE
+        
+        with open(filepath, 'wb') as file:
+            while True:
+                try:
+                    chunk = audio_stream.read(chunk_size)
+                except Exception as e:
+                    # A partial MP3 is not a usable result - fail the request rather than keep it
+                    logger.error(f"Error reading audio stream chunk: {e}")
+                    raise
+                if not chunk:
+                    break
+                
+                if first_byte_time is None:
+                    first_byte_time = time.time()
+                    logger.info(f"🟢 FIRST BYTES RECEIVED ({first_byte_time - download_start:.3f}s delay)")
+                
+                file.write(chunk)
+                bytes_written += len(chunk)
+                if on_chunk:
+                    on_chunk = self._feed_chunk(on_chunk, chunk)
+        
+        download_end = time.time()
+        logger.info(f"⬇️ POLLY DOWNLOAD END ({download_end - download_start:.3f}s total, {bytes_written} bytes)")
+        
+        if first_byte_time and logger.isEnabledFor(logging.INFO):
+            actual_transfer_time = download_end - first_byte_time
+            bytes_per_sec = bytes_written / actual_transfer_time if actual_transfer_time > 0 else 0
+            logger.info(f"📊 TRANSFER STATS: {actual_transfer_time:.3f}s transfer, {bytes_per_sec/1024:.1f} KB/s, {first_byte_time - download_start:.3f}s wait time")
+        
+        return audio_response
+
+    def _emit_file_chunks(self, filepath: str, on_chunk: Callable[[bytes], None]):
+        """Feed an already-written MP3 to on_chunk in stream-sized blocks"""
+        with open(filepath, 'rb') as f:
+            while on_chunk:
+                chunk = f.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                on_chunk = self._feed_chunk(on_chunk, chunk)
+
+    def _feed_chunk(self, on_chunk: Callable[[bytes], None], chunk: bytes) -> Optional[Callable[[bytes], None]]:
+        """Pass a chunk to on_chunk; returns None (stop calling it) if the callback fails
+        
+        A broken player must not cut the download short - the MP3 still has to reach disk.
+        """
+        try:
+            on_chunk(chunk)
+            return on_chunk
+        except Exception as e:
+            logger.warning(f"Audio chunk callback failed, continuing without it: {e}")
+            return None
+
+    def _use_synthesis_task(self, text: str) -> bool:
+        """Whether text is too long for synchronous synthesis and an S3 bucket is configured"""
+        return len(text) > SYNC_TEXT_LIMIT and bool(self.output_bucket)
+
+    def _synthesize_long(self, text: str, filepath: str) -> dict:
+        """Synthesize MP3 audio with an async Polly task and download the result from S3"""
+        task_start = time.time()
+        logger.info(f"🔊 POLLY SYNTHESIS TASK START ({len(text)} characters)")
+        task = self._run_synthesis_task(text, OutputFormat='mp3')
+        key = self._task_output_key(task)
+        
+        download_start = time.time()
+        logger.info(f"🔊 POLLY SYNTHESIS TASK END ({download_start - task_start:.3f}s)")
+        
+        from boto3.s3.transfer import TransferConfig
+        
+        # Multipart download pulls large outputs over several connections at once
+        transfer_config = TransferConfig(multipart_chunksize=8 * 1024 * 1024, max_concurrency=10)
+        try:
+            self.s3.download_file(self.output_bucket, key, filepath, Config=transfer_config)
+        finally:
+            self._delete_task_output(key)
+        logger.info(f"⬇️ S3 DOWNLOAD END ({time.time() - download_start:.3f}s, {os.path.getsize(filepath)} bytes)")
+        
+        return {'RequestCharacters': task.get('RequestCharacters', len(text))}
+
+    def _run_synthesis_task(self, text: str, **output_options) -> dict:
+        """Start a Polly synthesis task writing to S3 and wait for it to complete"""
+        response = self._call_polly(
+            'start_speech_synthesis_task',
+            Text=text,
+            VoiceId=self.voice_id,
+            Engine=self.engine,
+            LanguageCode=self.language_code,
+            OutputS3BucketName=self.output_bucket,
+            OutputS3KeyPrefix=TASK_KEY_PREFIX,
+            **output_options
+        )
+        task_id = response['SynthesisTask']['TaskId']
+        
+        # Poll with exponential backoff (0.25s doubling up to 4s)
+        deadline = time.monotonic() + SYNTHESIS_TASK_TIMEOUT
+        delay = 0.25
+        while True:
+            task = self._call_polly('get_speech_synthesis_task', TaskId=task_id)['SynthesisTask']
+            status = task['TaskStatus']
+            if status == 'completed':
+                return task
+            if status == 'failed':
+                raise RuntimeError(f"Polly synthesis task {task_id} failed: {task.get('TaskStatusReason', 'unknown reason')}")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Polly synthesis task {task_id} still {status} after {SYNTHESIS_TASK_TIMEOUT}s")
+            time.sleep(delay)
+            delay = min(delay * 2, 4.0)
+
+    def _task_output_key(self, task: dict) -> str:
+        """S3 key Polly writes a synthesis task's output to (prefix + task ID + format extension)"""
+        output_format = task['OutputFormat']
+        return f"{TASK_KEY_PREFIX}{task['TaskId']}.{_TASK_OUTPUT_EXTENSIONS.get(output_format, output_format)}"
+
+    def _delete_task_output(self, key: str):
+        """Remove a synthesis task's output from S3 once it has been read"""
+        try:
+            self.s3.delete_object(Bucket=self.output_bucket, Key=key)
+        except Exception as e:
+            logger.warning(f"Could not delete Polly task output s3://{self.output_bucket}/{key}: {e}")
+
+    def _fetch_speech_marks(self, text: str) -> list:
+        """Request viseme/word speech marks from Polly (runs on the background executor)"""
+        try:
+            if self._use_synthesis_task(text):
+                task = self._run_synthesis_task(text, OutputFormat='json', SpeechMarkTypes=['viseme', 'word'])
+                key = self._task_output_key(task)
+                try:
+                    speech_marks_data = self.s3.get_object(Bucket=self.output_bucket, Key=key)['Body'].read()
+                finally:
+                    self._delete_task_output(key)
+            else:
+                timing_response = self._call_polly(
+                    'synthesize_speech',
+                    Text=text,
+                    OutputFormat='json',
+                    VoiceId=self.voice_id,
+                    Engine=self.engine,
+                    LanguageCode=self.language_code,
+                    SpeechMarkTypes=['viseme', 'word']  # Get viseme AND word timing (viseme covers full audio)
+                )
+                speech_marks_data = timing_response['AudioStream'].read()
+            timing_data = self._process_speech_marks(speech_marks_data)
+            logger.info(f"Retrieved {len(timing_data)} timing marks from Polly")
+            return timing_data
+        except Exception as e:
+            logger.warning(f"Could not get speech marks from Polly: {e}")
+            return []
+
     def get_audio_duration(self, filepath: str) -> float:
         """Get audio duration in seconds (corrected estimation for Polly MP3s)"""
         try:
@@ -222,17 +677,16 @@ class TTSHandler:
         This ensures we have timing data that covers the entire audio duration.
         """
         try:
-            # Speech marks come as newline-separated JSON objects
-            speech_marks_str = speech_marks_data.decode('utf-8')
-            logger.info(f"Raw speech marks data: {speech_marks_str[:500]}...")
-            lines = speech_marks_str.strip().split('\n')
+            # Speech marks come as newline-separated JSON objects - parse the bytes directly
+            logger.info(f"Raw speech marks data: {speech_marks_data[:500].decode('utf-8', errors='replace')}...")
+            loads = orjson.loads if orjson else json.loads
             
             word_data = []
             viseme_data = []
             
-            for line in lines:
+            for line in speech_marks_data.split(b'\n'):
                 if line.strip():
-                    mark = json.loads(line)
+                    mark = loads(line)
                     mark_type = mark.get('type')
                     
                     if mark_type == 'word':
@@ -242,6 +696,9 @@ class TTSHandler:
                             "end_ms": mark['end']
                         })
                     elif mark_type == 'viseme':
+                        # Extend the previous viseme until this one starts (fills gaps between visemes)
+                        if viseme_data:
+                            viseme_data[-1]['end_ms'] = mark['time']
                         viseme_data.append({
                             "viseme": mark['value'],
                             "start_ms": mark['time'],
@@ -250,14 +707,7 @@ class TTSHandler:
             
             # Prefer viseme data for full coverage, but fall back to words
             if viseme_data:
-                # Extend viseme durations to fill gaps between visemes
-                for i, viseme in enumerate(viseme_data):
-                    if i < len(viseme_data) - 1:
-                        # Extend this viseme until the next one starts
-                        next_start = viseme_data[i + 1]['start_ms']
-                        viseme['end_ms'] = next_start
-                    # Last viseme keeps its current end_ms for now
-                
+                # Gaps were filled while parsing; the last viseme keeps its own end_ms
                 logger.info(f"Processed {len(viseme_data)} viseme timing marks from Polly (covers full audio)")
                 return viseme_data
             else:
@@ -273,55 +723,50 @@ class TTSHandler:
         if not words or total_duration <= 0:
             return []
         
-        timing_data = []
-        
-        # Calculate timing based on word length and characteristics
-        word_weights = []
-        for word in words:
-            # Base weight on word length
-            weight = len(word) + 1
-            
-            # Adjust for punctuation (longer pauses)
-            if word.endswith(('.', '!', '?')):
-                weight *= 1.5
-            elif word.endswith((',', ';', ':')):
-                weight *= 1.2
-            
-            word_weights.append(weight)
-        
+        # Weight by word length, with longer pauses after punctuation
+        word_weights = [
+            (len(word) + 1) * (1.5 if word.endswith(('.', '!', '?')) else 1.2 if word.endswith((',', ';', ':')) else 1)
+            for word in words
+        ]
         total_weight = sum(word_weights)
         
         # Distribute timing proportionally
-        current_time_ms = 0
         padding_ms = 100  # Small padding at start and end
         usable_duration_ms = (total_duration * 1000) - (2 * padding_ms)
+        durations = [max(100, (weight / total_weight) * usable_duration_ms) for weight in word_weights]  # Minimum 100ms per word
         
-        for i, word in enumerate(words):
-            # Calculate duration based on weight proportion
-            duration_ms = (word_weights[i] / total_weight) * usable_duration_ms
-            duration_ms = max(100, duration_ms)  # Minimum 100ms per word
-            
-            start_ms = current_time_ms + padding_ms
-            end_ms = start_ms + duration_ms
-            
-            timing_data.append({
+        # Each word starts where the previous one ended
+        timing_data = [
+            {
                 "word": word,
-                "start_ms": int(start_ms),
-                "end_ms": int(end_ms)
-            })
-            
-            current_time_ms += duration_ms
+                "start_ms": int(offset_ms + padding_ms),
+                "end_ms": int(offset_ms + padding_ms + duration_ms)
+            }
+            for word, duration_ms, offset_ms in zip(words, durations, accumulate(durations, initial=0))
+        ]
         
         logger.info(f"Generated {len(timing_data)} word timings for {total_duration:.2f}s audio")
         return timing_data
     
+    def _describe_voices(self) -> dict:
+        """describe_voices for the current engine/language, cached for VOICES_CACHE_TTL seconds"""
+        cache_key = (self.engine, self.language_code)
+        cached = self._voices_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        response = self._call_polly(
+            'describe_voices',
+            Engine=self.engine,
+            LanguageCode=self.language_code
+        )
+        self._voices_cache[cache_key] = (time.monotonic() + VOICES_CACHE_TTL, response)
+        return response
+
     def get_available_voices(self) -> list:
         """Get list of available Polly voice IDs"""
         try:
-            response = self.polly.describe_voices(
-                Engine=self.engine,
-                LanguageCode=self.language_code
-            )
+            response = self._describe_voices()
             voices = [voice['Id'] for voice in response['Voices']]
             logger.info(f"Available voices: {voices}")
             return voices
@@ -332,10 +777,7 @@ class TTSHandler:
     def get_voice_details(self) -> list:
         """Get detailed information about available Polly voices"""
         try:
-            response = self.polly.describe_voices(
-                Engine=self.engine,
-                LanguageCode=self.language_code
-            )
+            response = self._describe_voices()
             voices = []
             for voice in response['Voices']:
                 voices.append({
@@ -4,15 +4,67 @@ Converts xLights XSQ sequences to FPP FSEQ format for themed character interacti
 """
 
 import os
-import xml.etree.ElementTree as ET
+import re
 import struct
 import logging
-from typing import Dict, List, Tuple, Any
+from functools import lru_cache
+from typing import Dict, List, Tuple, Any, Callable, Optional
 from mutagen import File as MutagenFile
+from .audio_utils import mp3_duration
 from .model_manager import ModelManager
 
+try:
+    from lxml import etree as ET  # Optional: faster XSQ parsing (same API as ElementTree)
+except ImportError:
+    import xml.etree.ElementTree as ET
+
 logger = logging.getLogger(__name__)
 
+# FSEQ v2.0 header (32 bytes): magic, data offset, version minor/major, header length, channel count,
+# frame count, step time (ms), flags, compression, compression blocks, sparse ranges, reserved, unique ID
+_FSEQ_HEADER = struct.Struct('<4sHBBHIIBBBBBBQ')
+
+# xLights effect types as small ints (parsed effects carry a type_id column)
+EFFECT_ON, EFFECT_SINGLE_STRAND, EFFECT_FACES, EFFECT_MORPH, EFFECT_CHASE, EFFECT_COLOR_WASH = range(6)
+EFFECT_UNKNOWN = -1
+EFFECT_TYPE_IDS = {
+    'On': EFFECT_ON,
+    'SingleStrand': EFFECT_SINGLE_STRAND,
+    'Faces': EFFECT_FACES,
+    'Morph': EFFECT_MORPH,
+    'Chase': EFFECT_CHASE,
+    'ColorWash': EFFECT_COLOR_WASH,
+}
+
+# One node ('10') or node range ('14-27') inside a comma-separated node string
+_NODE_RANGE_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+@lru_cache(maxsize=256)
+def _parse_node_ranges_cached(range_string: str) -> Tuple[int, ...]:
+    """Parse a node range string once; face effects render the same few strings every frame"""
+    nodes = []
+    for start, end in _NODE_RANGE_RE.findall(range_string):
+        if end:
+            nodes.extend(range(int(start), int(end) + 1))
+        else:
+            nodes.append(int(start))
+    return tuple(nodes)
+
+def _preallocate(fd: int, size: int):
+    """Reserve the file's full size up front (Linux/Unix only; best effort)"""
+    if not hasattr(os, 'posix_fallocate'):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        pass  # Filesystem doesn't support it - the writes will extend the file as usual
+
+def _write_all(fd: int, data):
+    """os.write until every byte is out (a single call may write less than asked)"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
 class XLightsConverter:
     """Convert xLights XSQ sequences to FPP FSEQ binary format"""
     
@@ -20,6 +72,12 @@ class XLightsConverter:
         self.model_manager = ModelManager()
         self.output_dir = "output"
         os.makedirs(self.output_dir, exist_ok=True)
+        # Active models and their 0-based start channels / channel counts / face channels, looked up once per conversion
+        self._active_models_cache = {}
+        self._start_channel_by_model = {}
+        self._channel_count_by_model = {}
+        self._phoneme_channels_by_model = {}
+        self._total_channels = 450
     
     def convert_sequence_to_fseq(self, xsq_file: str, audio_file: str, output_name: str = None) -> str:
         """
@@ -36,6 +94,9 @@ class XLightsConverter:
         try:
             logger.info(f"🎬 Converting xLights sequence: {xsq_file}")
             
+            # Model configuration doesn't change during a conversion - read it once
+            self._cache_active_models()
+            
             # Parse the XSQ file
             xsq_data = self._parse_xsq_file(xsq_file)
             
@@ -51,7 +112,8 @@ class XLightsConverter:
             fseq_path = os.path.join(self.output_dir, f"{output_name}.fseq")
             
             # Convert XSQ timing and effects to FSEQ binary
-            self._create_fseq_from_xsq(xsq_data, duration_ms, fseq_path)
+            audio_filename = os.path.basename(audio_file) if audio_file else ""
+            self._create_fseq_from_xsq(xsq_data, duration_ms, fseq_path, audio_filename)
             
             logger.info(f"✅ Converted to FSEQ: {fseq_path}")
             return fseq_path
@@ -60,16 +122,47 @@ class XLightsConverter:
             logger.error(f"❌ Error converting XSQ to FSEQ: {e}")
             raise
     
+    def _cache_active_models(self):
+        """Snapshot the active models' 0-based start channels, channel counts and face channels for this conversion"""
+        self._active_models_cache = self.model_manager.get_active_models()
+        self._start_channel_by_model = {
+            model_name: model_info.get('start_channel', 1) - 1
+            for model_name, model_info in self._active_models_cache.items()
+        }
+        self._channel_count_by_model = {
+            model_name: model_info.get('channel_count', 450)
+            for model_name, model_info in self._active_models_cache.items()
+        }
+        # Frame size (450 = default for reindeer)
+        self._total_channels = max(self._channel_count_by_model.values(), default=450) or 450
+        # Face models: the frame channels of each mouth shape, so Faces effects don't re-parse node ranges
+        self._phoneme_channels_by_model = {
+            model_name: self._phoneme_channels(model_info.get('face_info', {}), self._start_channel_by_model[model_name])
+            for model_name, model_info in self._active_models_cache.items()
+            if model_info.get('type') == 'face'
+        }
+    
+    def _phoneme_channels(self, face_info: Dict, start_channel: int) -> Dict[str, Tuple[int, ...]]:
+        """Map each mouth shape to the R channel of every pixel it lights (pixels outside the frame are dropped)"""
+        phoneme_channels = {}
+        for phoneme, nodes_str in face_info.get('mouth_shapes', {}).items():
+            rgb_starts = [start_channel + (node_num - 1) * 3 for node_num in _parse_node_ranges_cached(nodes_str)]
+            in_frame = tuple(rgb_start for rgb_start in rgb_starts if 0 <= rgb_start and rgb_start + 2 < self._total_channels)
+            if len(in_frame) < len(rgb_starts):
+                logger.warning(f"Mouth shape {phoneme}: {len(rgb_starts) - len(in_frame)} nodes fall outside the {self._total_channels}-channel frame")
+            phoneme_channels[phoneme] = in_frame
+        return phoneme_channels
+    
     def _parse_xsq_file(self, xsq_file: str) -> Dict[str, Any]:
-        """Parse xLights XSQ sequence file and extract timing/effect data"""
+        """Parse xLights XSQ sequence file and extract timing/effect data
+        
+        Single streaming pass: each Interval/Effect is read on its end event and
+        cleared straight away, so large sequences never sit fully in memory.
+        """
         try:
-            tree = ET.parse(xsq_file)
-            root = tree.getroot()
-            
-            # Extract sequence metadata
             sequence_data = {
-                'name': root.get('name', 'Unknown'),
-                'version': root.get('version', '4'),
+                'name': 'Unknown',
+                'version': '4',
                 'timing': [],
                 'effects': [],
                 'models': {},
@@ -77,63 +170,86 @@ class XLightsConverter:
                 'duration_ms': 0
             }
             
-            # Parse timing tracks (for lip-sync and cues)
-            timing_tracks = root.findall('.//TimingTrack')
-            for track in timing_tracks:
-                track_name = track.get('name', '')
-                track_data = {
-                    'name': track_name,
-                    'type': track.get('type', 'timing'),
-                    'intervals': []
-                }
-                
-                # Parse timing intervals
-                for interval in track.findall('.//Interval'):
-                    start = float(interval.get('start', 0))
-                    end = float(interval.get('end', 0))
-                    label = interval.get('label', '')
-                    
-                    track_data['intervals'].append({
-                        'start_ms': int(start * 1000),
-                        'end_ms': int(end * 1000),
-                        'label': label,
-                        'duration_ms': int((end - start) * 1000)
-                    })
-                
-                sequence_data['timing'].append(track_data)
+            # Open TimingTrack/Model containers (children belong to every enclosing one)
+            open_tracks = []
+            open_models = []
+            root = None
             
-            # Parse model effects
-            models = root.findall('.//Model')
-            for model in models:
-                model_name = model.get('name', '')
-                model_data = {
-                    'name': model_name,
-                    'type': model.get('ModelType', 'unknown'),
-                    'effects': []
-                }
+            for event, elem in ET.iterparse(xsq_file, events=('start', 'end')):
+                tag = elem.tag
                 
-                # Parse effects for this model
-                effects = model.findall('.//Effect')
-                for effect in effects:
-                    start_time = float(effect.get('startTime', 0))
-                    end_time = float(effect.get('endTime', 0))
-                    effect_type = effect.get('type', 'unknown')
-                    
-                    effect_data = {
-                        'start_ms': int(start_time * 1000),
-                        'end_ms': int(end_time * 1000),
-                        'type': effect_type,
-                        'settings': {}
-                    }
+                if event == 'start':
+                    if root is None:
+                        # Extract sequence metadata
+                        root = elem
+                        sequence_data['name'] = elem.get('name', 'Unknown')
+                        sequence_data['version'] = elem.get('version', '4')
                     
-                    # Parse effect settings/parameters
-                    for attr in effect.attrib:
-                        if attr not in ['startTime', 'endTime', 'type']:
-                            effect_data['settings'][attr] = effect.get(attr)
+                    # Timing tracks (for lip-sync and cues)
+                    elif tag == 'TimingTrack':
+                        track_data = {
+                            'name': elem.get('name', ''),
+                            'type': elem.get('type', 'timing'),
+                            'intervals': []
+                        }
+                        sequence_data['timing'].append(track_data)
+                        open_tracks.append(track_data)
                     
-                    model_data['effects'].append(effect_data)
+                    elif tag == 'Model':
+                        model_name = elem.get('name', '')
+                        # Effects are stored column-wise (one list per field, index = effect)
+                        model_data = {
+                            'name': model_name,
+                            'type': elem.get('ModelType', 'unknown'),
+                            'effects': {'start_ms': [], 'end_ms': [], 'type': [], 'type_id': [], 'settings': []}
+                        }
+                        sequence_data['models'][model_name] = model_data
+                        open_models.append(model_data)
+                    continue
+                
+                if tag == 'Interval':
+                    if open_tracks:
+                        start = float(elem.get('start', 0))
+                        end = float(elem.get('end', 0))
+                        interval = {
+                            'start_ms': int(start * 1000),
+                            'end_ms': int(end * 1000),
+                            'label': elem.get('label', ''),
+                            'duration_ms': int((end - start) * 1000)
+                        }
+                        for track_data in open_tracks:
+                            track_data['intervals'].append(interval)
+                    elem.clear()
                 
-                sequence_data['models'][model_name] = model_data
+                elif tag == 'Effect':
+                    if open_models:
+                        start_ms = int(float(elem.get('startTime', 0)) * 1000)
+                        end_ms = int(float(elem.get('endTime', 0)) * 1000)
+                        effect_type = elem.get('type', 'unknown')
+                        type_id = EFFECT_TYPE_IDS.get(effect_type, EFFECT_UNKNOWN)
+                        
+                        # Parse effect settings/parameters
+                        settings = {}
+                        for attr in elem.attrib:
+                            if attr not in ['startTime', 'endTime', 'type']:
+                                settings[attr] = elem.get(attr)
+                        
+                        for model_data in open_models:
+                            effects_data = model_data['effects']
+                            effects_data['start_ms'].append(start_ms)
+                            effects_data['end_ms'].append(end_ms)
+                            effects_data['type'].append(effect_type)
+                            effects_data['type_id'].append(type_id)
+                            effects_data['settings'].append(settings)
+                    elem.clear()
+                
+                elif tag == 'TimingTrack':
+                    open_tracks.pop()
+                    elem.clear()
+                
+                elif tag == 'Model':
+                    open_models.pop()
+                    elem.clear()
             
             return sequence_data
             
@@ -145,6 +261,15 @@ class XLightsConverter:
         """Get audio file duration in milliseconds"""
         try:
             logger.info(f"🔧 Getting audio duration for: {audio_file}")
+            
+            # MP3: read the duration from the frame headers instead of a full Mutagen parse
+            if audio_file.lower().endswith('.mp3'):
+                duration_s = mp3_duration(audio_file)
+                if duration_s:
+                    duration_ms = int(duration_s * 1000)
+                    logger.info(f"🔧 Audio duration: {duration_ms}ms ({duration_ms/1000:.2f}s)")
+                    return duration_ms
+            
             audio_info = MutagenFile(audio_file)
             if audio_info and hasattr(audio_info, 'info'):
                 duration_ms = int(audio_info.info.length * 1000)
@@ -156,22 +281,15 @@ class XLightsConverter:
             logger.warning(f"Could not get audio duration: {e}, using default 30s")
             return 30000
     
-    def _create_fseq_from_xsq(self, xsq_data: Dict[str, Any], duration_ms: int, output_path: str):
+    def _create_fseq_from_xsq(self, xsq_data: Dict[str, Any], duration_ms: int, output_path: str, audio_filename: str = ""):
         """Create FSEQ binary file from parsed XSQ data"""
         try:
             logger.info(f"🔧 _create_fseq_from_xsq called with duration_ms={duration_ms}")
             
             # Get total channel count from active models
-            active_models = self.model_manager.get_active_models()
-            total_channels = 0
-            
-            for model_name, model_info in active_models.items():
-                channels = model_info.get('channel_count', 450)
-                if channels > total_channels:
-                    total_channels = channels
-            
-            if total_channels == 0:
-                total_channels = 450  # Default for reindeer
+            if not self._active_models_cache:
+                self._cache_active_models()
+            total_channels = self._total_channels
             
             # Frame timing
             frame_rate = xsq_data.get('frame_rate', 20)
@@ -180,142 +298,162 @@ class XLightsConverter:
             
             logger.info(f"🔧 Calculated: num_frames={num_frames}, total_channels={total_channels}, frame_rate={frame_rate}, frame_duration_ms={frame_duration_ms}")
             
-            # Generate frame data using XSQ effects AND phoneme data
-            frame_data = []
-            for frame_idx in range(num_frames):
-                current_time_ms = frame_idx * frame_duration_ms
+            # Generate frame data from the per-model XSQ effects - exactly one frame per step,
+            # rendered through memoryview rows of one zeroed buffer for the whole sequence
+            frame_effects, dynamic_frames = self._bucket_effects_by_frame(xsq_data, num_frames, frame_duration_ms)
+            frames = bytearray(num_frames * total_channels)
+            frames_view = memoryview(frames)
+            
+            # Frames with the same set of static effects are identical - render the first one,
+            # copy it for the rest. Frames with a Morph/Chase running depend on time, so never match.
+            rendered_rows = {}  # tuple of static renderers -> offset of the rendered frame
+            frame_idx = 0
+            while frame_idx < num_frames:
+                active_effects = frame_effects[frame_idx]
+                is_dynamic = dynamic_frames[frame_idx]
                 
-                # Create frame with XSQ effects (this was the original logic)
-                frame = bytearray(total_channels)
+                # Fast path: a run of consecutive frames with the same static effects is rendered
+                # (or copied) once, then repeated over the whole run in one slice assignment
+                run_end = frame_idx + 1
+                if not is_dynamic:
+                    while run_end < num_frames and not dynamic_frames[run_end] and frame_effects[run_end] == active_effects:
+                        run_end += 1
                 
-                # Apply XSQ effects to the frame
-                for effect in xsq_data.get('effects', []):
-                    self._apply_effect_to_frame(frame, effect, current_time_ms, total_channels)
+                if active_effects:  # Otherwise the run stays blank
+                    current_time_ms = frame_idx * frame_duration_ms
+                    row_start = frame_idx * total_channels
+                    row = frames_view[row_start:row_start + total_channels]
+                    
+                    key = None if is_dynamic else tuple(active_effects)
+                    source_start = rendered_rows.get(key)
+                    if source_start is not None:
+                        row[:] = frames_view[source_start:source_start + total_channels]
+                    else:
+                        self._generate_frame_from_xsq(active_effects, current_time_ms, row)
+                        if key is not None:
+                            rendered_rows[key] = row_start
+                    
+                    if run_end - frame_idx > 1:
+                        frames_view[row_start + total_channels:run_end * total_channels] = row.tobytes() * (run_end - frame_idx - 1)
                 
-                frame_data.append(bytes(frame))
-                frame = self._generate_frame_from_xsq(xsq_data, current_time_ms, total_channels)
-                frame_data.append(bytes(frame))
+                frame_idx = run_end
             
             # Write FSEQ v2.0 file
-            self._write_fseq_file(output_path, frame_data, total_channels, frame_rate)
+            self._write_fseq_file(output_path, frames_view, num_frames, total_channels, frame_duration_ms, audio_filename)
             
         except Exception as e:
             logger.error(f"Error creating FSEQ from XSQ: {e}")
             raise
     
-    def _generate_frame_from_xsq(self, xsq_data: Dict[str, Any], time_ms: int, total_channels: int) -> List[int]:
-        """Generate a single frame based on XSQ effects active at given time"""
-        # Initialize all channels to 0
-        channels = [0] * total_channels
+    def _bucket_effects_by_frame(self, xsq_data: Dict[str, Any], num_frames: int, frame_duration_ms: int) -> Tuple[List[List[Callable]], List[bool]]:
+        """List, for every frame, the renderers of the effects active during it
+        
+        Also returns per-frame flags for whether a time-dependent (Morph/Chase) effect is active.
+        """
+        frame_effects = [[] for _ in range(num_frames)]
+        dynamic_frames = [False] * num_frames
         
-        # Apply effects from each model that are active at this time
         for model_name, model_data in xsq_data['models'].items():
-            # Find corresponding active model
-            active_models = self.model_manager.get_active_models()
+            # Only effects on active models are rendered
+            start_channel = self._start_channel_by_model.get(model_name)
+            if start_channel is None:
+                continue
+            channel_count = self._channel_count_by_model[model_name]
+            phoneme_channels = self._phoneme_channels_by_model.get(model_name)
             
-            if model_name in active_models:
-                model_info = active_models[model_name]
-                start_channel = model_info.get('start_channel', 1) - 1  # Convert to 0-based
+            effects = model_data['effects']
+            for start_ms, end_ms, type_id, settings in zip(effects['start_ms'], effects['end_ms'], effects['type_id'], effects['settings']):
+                renderer = self._effect_renderer(type_id, start_ms, end_ms, settings, start_channel, channel_count, phoneme_channels)
+                if renderer is None:
+                    continue
                 
-                # Apply all effects active at this time
-                for effect in model_data['effects']:
-                    if effect['start_ms'] <= time_ms <= effect['end_ms']:
-                        self._apply_xsq_effect(channels, effect, model_info, start_channel, time_ms)
+                # Frames whose time falls inside [start_ms, end_ms] (both ends inclusive)
+                first_frame = max(0, -(-start_ms // frame_duration_ms))
+                last_frame = min(num_frames - 1, end_ms // frame_duration_ms)
+                for frame_idx in range(first_frame, last_frame + 1):
+                    frame_effects[frame_idx].append(renderer)
+                if type_id in (EFFECT_MORPH, EFFECT_CHASE):
+                    dynamic_frames[first_frame:last_frame + 1] = [True] * max(0, last_frame + 1 - first_frame)
         
-        return channels
+        return frame_effects, dynamic_frames
+    
+    def _generate_frame_from_xsq(self, active_effects: List[Callable], time_ms: int, channels: memoryview):
+        """Render the XSQ effects active at given time into a zeroed frame buffer"""
+        for renderer in active_effects:
+            renderer(channels, time_ms)
     
-    def _apply_xsq_effect(self, channels: List[int], effect: Dict, model_info: Dict, start_channel: int, time_ms: int):
-        """Apply a specific XSQ effect to the channel data"""
-        effect_type = effect['type']
-        settings = effect['settings']
+    def _effect_renderer(self, type_id: int, start_ms: int, end_ms: int, settings: Dict, start_channel: int, channel_count: int, phoneme_channels: Optional[Dict[str, Tuple[int, ...]]]) -> Optional[Callable]:
+        """Resolve an XSQ effect to a renderer(channels, time_ms) once, rather than per frame
         
+        Returns None for effects that draw nothing, so they never reach the frame loop.
+        """
         # Handle different effect types from xLights
-        if effect_type == 'On':
+        if type_id == EFFECT_ON:
             # Simple "On" effect - light up the model
-            self._apply_on_effect(channels, model_info, start_channel, settings)
+            return lambda channels, time_ms: self._apply_on_effect(channels, channel_count, start_channel, settings)
         
-        elif effect_type == 'SingleStrand':
+        elif type_id == EFFECT_SINGLE_STRAND:
             # Single color effect
-            self._apply_color_effect(channels, model_info, start_channel, settings)
+            return lambda channels, time_ms: self._apply_color_effect(channels, channel_count, start_channel, settings)
         
-        elif effect_type == 'Faces':
-            # Face/phoneme effect for lip-sync
-            self._apply_face_effect(channels, model_info, start_channel, settings, time_ms, effect)
+        elif type_id == EFFECT_FACES:
+            # Face/phoneme effect for lip-sync (only face models have mouth shapes)
+            rgb_starts = (phoneme_channels or {}).get(settings.get('Phoneme', 'rest'))
+            if not rgb_starts:
+                return None
+            color = bytes(self._parse_color_setting(settings.get('color', '#FFFFFF')))
+            return lambda channels, time_ms: self._apply_face_effect(channels, rgb_starts, color)
         
-        elif effect_type in ['Morph', 'ColorWash', 'Chase']:
-            # Dynamic effects
-            self._apply_dynamic_effect(channels, model_info, start_channel, settings, effect_type, time_ms, effect)
+        elif type_id in (EFFECT_MORPH, EFFECT_CHASE):
+            # Dynamic effects (ColorWash isn't rendered yet)
+            return lambda channels, time_ms: self._apply_dynamic_effect(channels, channel_count, start_channel, settings, type_id, time_ms, start_ms, end_ms)
         
         # Add more effect types as needed
+        return None
     
-    def _apply_on_effect(self, channels: List[int], model_info: Dict, start_channel: int, settings: Dict):
+    def _apply_on_effect(self, channels: memoryview, channel_count: int, start_channel: int, settings: Dict):
         """Apply simple 'On' effect"""
-        channel_count = model_info.get('channel_count', 450)
-        
         # Parse color from settings
         color = self._parse_color_setting(settings.get('color', '#FFFFFF'))
         
         # Apply to all channels of the model
-        for i in range(0, channel_count, 3):  # RGB groups
-            if start_channel + i + 2 < len(channels):
-                channels[start_channel + i] = color[0]      # R
-                channels[start_channel + i + 1] = color[1]  # G
-                channels[start_channel + i + 2] = color[2]  # B
+        self._fill_rgb(channels, start_channel, channel_count, color)
+    
+    def _fill_rgb(self, channels: memoryview, start_channel: int, channel_count: int, color: Tuple[int, int, int]):
+        """Set every RGB pixel of a model to one color with a single slice assignment"""
+        # Whole pixels covering the model, clipped to the end of the frame
+        pixels = min((channel_count + 2) // 3, max(0, len(channels) - start_channel) // 3)
+        channels[start_channel:start_channel + pixels * 3] = bytes(color) * pixels
     
-    def _apply_color_effect(self, channels: List[int], model_info: Dict, start_channel: int, settings: Dict):
+    def _apply_color_effect(self, channels: memoryview, channel_count: int, start_channel: int, settings: Dict):
         """Apply color effect"""
         # Similar to On effect but may have additional color logic
-        self._apply_on_effect(channels, model_info, start_channel, settings)
+        self._apply_on_effect(channels, channel_count, start_channel, settings)
     
-    def _apply_face_effect(self, channels: List[int], model_info: Dict, start_channel: int, settings: Dict, time_ms: int, effect: Dict):
-        """Apply face/lip-sync effect"""
-        if model_info.get('type') == 'face':
-            # Use face definitions from the model
-            face_info = model_info.get('face_info', {})
-            
-            # Parse phoneme from effect settings or timing
-            phoneme = settings.get('Phoneme', 'rest')
-            
-            # Apply face effect using model's face definitions
-            self._apply_model_face_effect(channels, face_info, start_channel, phoneme, settings)
+    def _apply_face_effect(self, channels: memoryview, rgb_starts: Tuple[int, ...], color: bytes):
+        """Apply face/lip-sync effect: light the mouth shape's pixels (precomputed, in-frame R channels)"""
+        for rgb_start in rgb_starts:
+            channels[rgb_start:rgb_start + 3] = color
     
-    def _apply_model_face_effect(self, channels: List[int], face_info: Dict, start_channel: int, phoneme: str, settings: Dict):
-        """Apply face effect using model face definitions"""
-        mouth_shapes = face_info.get('mouth_shapes', {})
-        
-        if phoneme in mouth_shapes:
-            nodes_str = mouth_shapes[phoneme]
-            nodes = self._parse_node_ranges(nodes_str)
-            
-            # Parse color and brightness
-            color = self._parse_color_setting(settings.get('color', '#FFFFFF'))
-            
-            for node_num in nodes:
-                rgb_start = start_channel + ((node_num - 1) * 3)
-                if rgb_start + 2 < len(channels):
-                    channels[rgb_start] = color[0]      # R
-                    channels[rgb_start + 1] = color[1]  # G
-                    channels[rgb_start + 2] = color[2]  # B
-    
-    def _apply_dynamic_effect(self, channels: List[int], model_info: Dict, start_channel: int, settings: Dict, effect_type: str, time_ms: int, effect: Dict):
+    def _apply_dynamic_effect(self, channels: memoryview, channel_count: int, start_channel: int, settings: Dict, type_id: int, time_ms: int, start_ms: int, end_ms: int):
         """Apply dynamic effects like morph, chase, etc."""
         # Calculate effect progress (0.0 to 1.0)
-        effect_duration = effect['end_ms'] - effect['start_ms']
+        effect_duration = end_ms - start_ms
         if effect_duration > 0:
-            progress = (time_ms - effect['start_ms']) / effect_duration
+            progress = (time_ms - start_ms) / effect_duration
         else:
             progress = 0.0
         
         # Apply effect based on type and progress
-        if effect_type == 'Morph':
+        if type_id == EFFECT_MORPH:
             # Morphing between colors
-            self._apply_morph_effect(channels, model_info, start_channel, settings, progress)
-        elif effect_type == 'Chase':
+            self._apply_morph_effect(channels, channel_count, start_channel, settings, progress)
+        elif type_id == EFFECT_CHASE:
             # Chasing effect
-            self._apply_chase_effect(channels, model_info, start_channel, settings, progress)
+            self._apply_chase_effect(channels, channel_count, start_channel, settings, progress)
         # Add more dynamic effects as needed
     
-    def _apply_morph_effect(self, channels: List[int], model_info: Dict, start_channel: int, settings: Dict, progress: float):
+    def _apply_morph_effect(self, channels: memoryview, channel_count: int, start_channel: int, settings: Dict, progress: float):
         """Apply color morphing effect"""
         # Simple morph between two colors based on progress
         color1 = self._parse_color_setting(settings.get('color1', '#FF0000'))
@@ -326,17 +464,11 @@ class XLightsConverter:
         g = int(color1[1] + (color2[1] - color1[1]) * progress)
         b = int(color1[2] + (color2[2] - color1[2]) * progress)
         
-        channel_count = model_info.get('channel_count', 450)
-        for i in range(0, channel_count, 3):
-            if start_channel + i + 2 < len(channels):
-                channels[start_channel + i] = r
-                channels[start_channel + i + 1] = g
-                channels[start_channel + i + 2] = b
+        self._fill_rgb(channels, start_channel, channel_count, (r, g, b))
     
-    def _apply_chase_effect(self, channels: List[int], model_info: Dict, start_channel: int, settings: Dict, progress: float):
+    def _apply_chase_effect(self, channels: memoryview, channel_count: int, start_channel: int, settings: Dict, progress: float):
         """Apply chase effect"""
         # Simple chase effect - light moves across nodes
-        channel_count = model_info.get('channel_count', 450)
         node_count = channel_count // 3
         
         color = self._parse_color_setting(settings.get('color', '#FFFFFF'))
@@ -344,15 +476,15 @@ class XLightsConverter:
         # Calculate which node should be lit based on progress
         active_node = int(progress * node_count) % node_count
         
-        # Light up the active node
+        # Light up the active node (one pixel per frame - a single range check is enough)
         rgb_start = start_channel + (active_node * 3)
         if rgb_start + 2 < len(channels):
-            channels[rgb_start] = color[0]
-            channels[rgb_start + 1] = color[1]
-            channels[rgb_start + 2] = color[2]
+            channels[rgb_start:rgb_start + 3] = bytes(color)
     
-    def _parse_color_setting(self, color_str: str) -> Tuple[int, int, int]:
-        """Parse color string to RGB tuple"""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_color_setting(color_str: str) -> Tuple[int, int, int]:
+        """Parse color string to RGB tuple (cached - effects re-read the same settings every frame)"""
         if color_str.startswith('#'):
             # Hex color
             hex_color = color_str[1:]
@@ -366,51 +498,35 @@ class XLightsConverter:
         # Default to white if parsing fails
         return (255, 255, 255)
     
-    def _parse_node_ranges(self, range_string: str) -> List[int]:
-        """Parse node range string like '14-27,33-34,40-41' into list of node numbers"""
-        nodes = []
-        
-        for range_part in range_string.split(','):
-            range_part = range_part.strip()
-            if '-' in range_part:
-                start, end = map(int, range_part.split('-'))
-                nodes.extend(range(start, end + 1))
-            elif range_part.isdigit():
-                nodes.append(int(range_part))
-        
-        return nodes
-    
-    def _write_fseq_file(self, output_path: str, frame_data: List[bytes], total_channels: int, frame_rate: int):
+    def _write_fseq_file(self, output_path: str, frames: memoryview, num_frames: int, total_channels: int, frame_duration_ms: int, audio_filename: str = ""):
         """Write FSEQ v2.0 binary file"""
         try:
-            # Get audio filename for embedding in FSEQ
-            audio_filename = os.path.basename(audio_file) if audio_file else ""
+            logger.info(f"🔧 Writing FSEQ header: frames={num_frames}, channels={total_channels}, step={frame_duration_ms}ms, audio={audio_filename}")
+            
+            # FSEQ Header (Version 2.0, same 32-byte layout as SequenceGenerator), packed in one call
+            header = _FSEQ_HEADER.pack(
+                b'FSEQ',            # Magic number
+                32,                 # Channel data offset
+                0, 2,               # Version minor, major
+                32,                 # Header length
+                total_channels,     # Channel count
+                num_frames,         # Frame count
+                frame_duration_ms,  # Step time (ms per frame)
+                0, 0, 0,            # Flags, compression, compression blocks
+                0, 0,               # Sparse ranges, reserved
+                0                   # Unique ID
+            )
+            # Unbuffered writes into a file preallocated at its final size
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                _preallocate(fd, len(header) + len(frames))
+                _write_all(fd, header)
+                _write_all(fd, frames)  # Straight from the frame buffer, no copy
+            finally:
+                os.close(fd)
+            
+            logger.info(f"Written FSEQ: {num_frames} frames, {total_channels} channels")
             
-            with open(output_path, 'wb') as f:
-                # Use the WORKING FSEQ header format from create_sequence()
-                logger.info(f"🔧 Writing FSEQ header: frames={len(frame_data)}, channels={total_channels}, rate={frame_rate}, audio={audio_filename}")
-                
-                # FSEQ Header (Version 2.0 - working format)
-                f.write(b'FSEQ')                # Magic number (4 bytes) - offset 0-3
-                f.write(struct.pack('<H', 32))  # Channel data offset (2 bytes) - offset 4-5
-                f.write(struct.pack('<B', 0))   # Version minor (1 byte) - offset 6
-                f.write(struct.pack('<B', 2))   # Version major (1 byte) - offset 7
-                f.write(struct.pack('<H', 32))  # Header length (2 bytes) - offset 8-9
-                f.write(struct.pack('<I', total_channels))  # Channel count (4 bytes)
-                f.write(struct.pack('<I', len(frame_data))) # Frame count (4 bytes)
-                f.write(struct.pack('<B', frame_rate))      # Step time ms (1 byte)
-                f.write(struct.pack('<B', 0))  # Flags = 0 (1 byte) 
-                f.write(struct.pack('<B', 0))  # Compression = 0 (1 byte)
-                f.write(struct.pack('<B', 0))  # Compression level = 0 (1 byte)
-                f.write(struct.pack('<I', 0))  # Sparse ranges = 0 (4 bytes)
-                f.write(struct.pack('<Q', 0))  # Unique ID (8 bytes)
-                
-                # Write frame data
-                for frame in frame_data:
-                    f.write(frame)
-                
-                logger.info(f"Written FSEQ: {len(frame_data)} frames, {total_channels} channels")
-                
         except Exception as e:
             logger.error(f"Error writing FSEQ file: {e}")
             raise
\ No newline at end of file
@@ -2,6 +2,7 @@
 """Create a minimal test FSEQ with just the Nose (nodes 43-50) in RED"""
 import struct
 import os
+import tempfile
 
 def create_test_fseq():
     """Create FSEQ with nodes 43-50 (Nose) in RED"""
@@ -56,5 +57,30 @@ def create_test_fseq():
     
     return output_file
 
+def test_converter_fseq_layout():
+    """XLightsConverter FSEQ output: 32-byte v2 header, then frames x channels of data"""
+    from src.xlights_converter import XLightsConverter
+    
+    num_frames, total_channels, frame_duration_ms = 10, 150 * 3, 50
+    frames = bytes(i % 251 for i in range(num_frames * total_channels))
+    
+    converter = XLightsConverter.__new__(XLightsConverter)  # Writer needs no model state
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_file = os.path.join(tmp_dir, "converter.fseq")
+        converter._write_fseq_file(output_file, memoryview(frames), num_frames, total_channels, frame_duration_ms)
+        with open(output_file, 'rb') as f:
+            data = f.read()
+    
+    assert len(data) == 32 + num_frames * total_channels, f"file is {len(data)} bytes"
+    assert data[0:4] == b'FSEQ'
+    data_offset, minor, major, header_len = struct.unpack_from('<HBBH', data, 4)
+    assert (data_offset, major, minor, header_len) == (32, 2, 0, 32)
+    channels, frame_count = struct.unpack_from('<II', data, 10)
+    assert (channels, frame_count) == (total_channels, num_frames)
+    assert data[18] == frame_duration_ms, f"step time {data[18]}"
+    assert data[32:] == frames
+    print(f"✅ Converter FSEQ layout OK: {len(data)} bytes, step {data[18]}ms")
+
 if __name__ == "__main__":
     create_test_fseq()
+    test_converter_fseq_layout()
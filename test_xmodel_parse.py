@@ -1,38 +1,63 @@
 #!/usr/bin/env python3
 """Quick inline test - no imports needed, just raw XML parsing"""
-import xml.etree.ElementTree as ET
+import os
+import sys
+import pathlib
+import functools
+import xml.parsers.expat
+from typing import Dict, FrozenSet, Tuple
 
 xmodel_file = "models/active_models/NorRednoseReindeer.xmodel"
-tree = ET.parse(xmodel_file)
-root = tree.getroot()
+
+# faceInfo attributes that are not node lists
+SKIP: FrozenSet[str] = frozenset(('Name', 'CustomColors', 'Type'))
+# '2-Color' / '3-Color' variants also end with '-Color'
+COLOR_SUFFIX = '-Color'
+
+# Face elements reported (with their -Color) at the end
+WANTED: Tuple[str, ...] = ('Mouth-AI', 'FaceOutline2', 'FaceOutline', 'Eyes-Open')
+
+# Attributes print in document order; sort them only when a diff-stable listing is wanted
+stable_order = '--verbose' in sys.argv or bool(os.environ.get('STABLE_ORDER'))
+
+@functools.lru_cache(maxsize=8)
+def _load(path: str, mtime_ns: int) -> Tuple[Dict[str, str], ...]:
+    """faceInfo attribute dicts of an xmodel; mtime_ns keys the cache so an edited file is reparsed"""
+    # Only faceInfo attributes are needed, so let expat hand them over as dicts - no Elements are built
+    face_infos: list = []
+    
+    def start_element(name: str, attrs: Dict[str, str]):
+        if name == 'faceInfo':
+            face_infos.append(attrs)
+    
+    parser = xml.parsers.expat.ParserCreate()
+    parser.StartElementHandler = start_element
+    # Small file: read it in one go and hand expat a single buffer
+    parser.Parse(pathlib.Path(path).read_bytes(), True)
+    return tuple(face_infos)
+
+face_infos = _load(xmodel_file, os.stat(xmodel_file).st_mtime_ns)
 
 print("=" * 60)
 print("FACE ELEMENTS FROM XMODEL:")
 print("=" * 60)
 
-for face_info in root.findall('.//faceInfo'):
+for face_info in face_infos:
     print(f"\nFound faceInfo element:")
-    for attr_name in sorted(face_info.attrib.keys()):
-        if attr_name.endswith('-Color') or attr_name.endswith('2-Color') or attr_name.endswith('3-Color'):
-            continue
-        if attr_name in ['Name', 'CustomColors', 'Type']:
+    items = sorted(face_info.items()) if stable_order else face_info.items()
+    for attr_name, nodes_str in items:
+        if attr_name in SKIP or attr_name.endswith(COLOR_SUFFIX):
             continue
-        
-        nodes_str = face_info.get(attr_name, '')
         if nodes_str:
             print(f"  {attr_name}: {nodes_str}")
 
 print("\n" + "=" * 60)
 print("CHECKING SPECIFICALLY FOR:")
 print("=" * 60)
-face_info = root.find('.//faceInfo')
-if face_info:
-    print(f"Mouth-AI: {face_info.get('Mouth-AI', 'NOT FOUND')}")
-    print(f"FaceOutline2: {face_info.get('FaceOutline2', 'NOT FOUND')}")
-    print(f"FaceOutline: {face_info.get('FaceOutline', 'NOT FOUND')}")
-    print(f"Eyes-Open: {face_info.get('Eyes-Open', 'NOT FOUND')}")
+attrs = face_infos[0] if face_infos else None
+if attrs is not None:
+    for name in WANTED:
+        print(f"{name}: {attrs.get(name, 'NOT FOUND')}")
     print(f"\nCorresponding colors:")
-    print(f"Mouth-AI-Color: {face_info.get('Mouth-AI-Color', 'NOT FOUND')}")
-    print(f"FaceOutline2-Color: {face_info.get('FaceOutline2-Color', 'NOT FOUND')}")
-    print(f"FaceOutline-Color: {face_info.get('FaceOutline-Color', 'NOT FOUND')}")
-    print(f"Eyes-Open-Color: {face_info.get('Eyes-Open-Color', 'NOT FOUND')}")
+    for name in WANTED:
+        print(f"{name}-Color: {attrs.get(f'{name}-Color', 'NOT FOUND')}")
@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 """Direct test of _find_latest_xsq"""
 import os
+from typing import Optional
 
 xsq_dir = "models/active_models"
-xsq_files = [f for f in os.listdir(xsq_dir) if f.endswith('.xsq')]
 
 print("XSQ files found:")
-for f in xsq_files:
-    full_path = os.path.join(xsq_dir, f)
-    mtime = os.path.getmtime(full_path)
-    print(f"  {f}: {mtime}")
+# Single pass: one stat per file (DirEntry caches it), tracking the newest as we go
+latest: Optional[str] = None
+latest_mtime: float = -1.0
+with os.scandir(xsq_dir) as it:
+    for e in it:
+        if e.name.startswith('.') or not e.name.endswith('.xsq') or not e.is_file():
+            continue
+        mtime: float = e.stat().st_mtime
+        print(f"  {e.name}: {mtime}")
+        if mtime > latest_mtime:
+            latest, latest_mtime = e.name, mtime
 
 print("\nFinding max:")
-latest = max(xsq_files, key=lambda f: os.path.getmtime(os.path.join(xsq_dir, f)))
 print(f"Latest: {latest}")